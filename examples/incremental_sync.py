@@ -209,6 +209,9 @@ def main():
         assert "Changed in RAM" in content, "Changes not persisted!"
         print("    Changes successfully persisted to disk")
 
+        # Stop the engine's worker threads
+        engine.close()
+
         # ---------------------------------------------------------------------
         # Summary
         # ---------------------------------------------------------------------
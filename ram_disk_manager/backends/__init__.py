@@ -16,15 +16,21 @@ Usage:
         path = backend.create(config)
 """
 
-from typing import Optional, Type
+from typing import Dict, Optional, Type
 import platform
 
 from .base import RamDiskBackend
 
+# Backend instances by platform name, created on first use. Backends only
+# cache capability probes (tool paths, privileges), so one can be shared.
+_BACKENDS: Dict[str, RamDiskBackend] = {}
+
 
 def get_backend(force_platform: Optional[str] = None) -> RamDiskBackend:
     """Get the appropriate backend for the current platform.
 
+    The backend for each platform is created once and reused by later calls.
+
     Args:
         force_platform: Override platform detection ("windows", "linux", or "darwin")
 
@@ -36,20 +42,11 @@ def get_backend(force_platform: Optional[str] = None) -> RamDiskBackend:
     """
     target = force_platform or platform.system().lower()
 
-    if target == "windows":
-        from .windows import WindowsBackend
-        return WindowsBackend()
-    elif target == "linux":
-        from .linux import LinuxBackend
-        return LinuxBackend()
-    elif target == "darwin":
-        from .macos import MacOSBackend
-        return MacOSBackend()
-    else:
-        raise NotImplementedError(
-            f"Platform '{target}' is not supported. "
-            f"Supported platforms: windows, linux, darwin (macOS)"
-        )
+    backend = _BACKENDS.get(target)
+    if backend is None:
+        backend = get_backend_class(target)()
+        _BACKENDS[target] = backend
+    return backend
 
 
 def get_backend_class(platform_name: str) -> Type[RamDiskBackend]:
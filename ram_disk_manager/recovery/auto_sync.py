@@ -13,6 +13,7 @@ from typing import Dict, List, Optional
 
 from ram_disk_manager.config import RamDiskConfig, ManagerConfig, SyncStrategy
 from ram_disk_manager.recovery.detector import (
+    MarkerCache,
     was_clean_shutdown,
     mark_clean_shutdown,
     clear_shutdown_marker,
@@ -84,6 +85,8 @@ class RecoveryManager:
             manager_config: Optional manager configuration
         """
         self.manager_config = manager_config or ManagerConfig()
+        # Parsed shutdown markers, re-read only when the file changes
+        self._marker_cache: MarkerCache = {}
 
     def recover(
         self,
@@ -110,7 +113,9 @@ class RecoveryManager:
         result = RecoveryResult()
 
         # Check clean shutdown status
-        result.clean_shutdown = was_clean_shutdown(config, self.manager_config)
+        result.clean_shutdown = was_clean_shutdown(
+            config, self.manager_config, self._marker_cache
+        )
 
         # Determine if recovery is needed
         if force_full_sync:
@@ -127,11 +132,18 @@ class RecoveryManager:
 
         # Clear shutdown marker for this session
         clear_shutdown_marker(config, self.manager_config)
+        self._marker_cache.clear()
 
         # Perform recovery if needed
         if result.recovery_needed:
+            # An error-free integrity check already names the files that
+            # differ, so copy just those rather than walking disk again
+            only = None
+            integrity = result.integrity_before
+            if integrity is not None and not integrity.errors:
+                only = integrity.missing_in_ram + integrity.mismatched_files
             try:
-                synced, copied, failed = self._sync_disk_to_ram(config)
+                synced, copied, failed = self._sync_disk_to_ram(config, only)
                 result.files_synced = synced
                 result.files_copied = copied
                 result.files_failed = failed
@@ -148,11 +160,17 @@ class RecoveryManager:
 
         return result
 
-    def _sync_disk_to_ram(self, config: RamDiskConfig) -> tuple:
+    def _sync_disk_to_ram(
+        self,
+        config: RamDiskConfig,
+        only: Optional[List[str]] = None
+    ) -> tuple:
         """Sync content from disk to RAM.
 
         Args:
             config: RAM disk configuration
+            only: Relative paths to copy, e.g. from an integrity check.
+                  None copies every file matching config.patterns.
 
         Returns:
             Tuple of (files_synced, files_copied, files_failed)
@@ -169,25 +187,37 @@ class RecoveryManager:
         files_copied: List[str] = []
         files_failed: List[str] = []
 
-        # Full sync: copy all matching files from disk to RAM
-        for pattern in config.patterns:
-            for disk_file in config.disk_path.glob(pattern):
-                if not disk_file.is_file():
-                    continue
+        # Loop-invariant config lookups bound to locals
+        disk_path = config.disk_path
+        ram_path = config.ram_path
+
+        if only is None:
+            # Full sync: copy all matching files from disk to RAM
+            disk_files = (
+                disk_file
+                for pattern in config.patterns
+                for disk_file in disk_path.glob(pattern)
+            )
+        else:
+            disk_files = (disk_path / rel_path for rel_path in only)
 
-                rel_path = disk_file.relative_to(config.disk_path)
-                ram_file = config.ram_path / rel_path
+        for disk_file in disk_files:
+            if not disk_file.is_file():
+                continue
 
-                try:
-                    # Create parent directories
-                    ram_file.parent.mkdir(parents=True, exist_ok=True)
+            rel_path = disk_file.relative_to(disk_path)
+            ram_file = ram_path / rel_path
 
-                    # Copy file
-                    shutil.copy2(disk_file, ram_file)
-                    files_copied.append(str(rel_path))
+            try:
+                # Create parent directories
+                ram_file.parent.mkdir(parents=True, exist_ok=True)
 
-                except (OSError, IOError) as e:
-                    files_failed.append(str(rel_path))
+                # Copy file
+                shutil.copy2(disk_file, ram_file)
+                files_copied.append(str(rel_path))
+
+            except (OSError, IOError) as e:
+                files_failed.append(str(rel_path))
 
         return len(files_copied), files_copied, files_failed
 
@@ -215,6 +245,7 @@ class RecoveryManager:
         # Write clean shutdown marker
         if success:
             success = mark_clean_shutdown(config, self.manager_config)
+            self._marker_cache.clear()
 
         return success
 
@@ -264,8 +295,12 @@ class RecoveryManager:
         Returns:
             Dict with status information
         """
-        clean = was_clean_shutdown(config, self.manager_config)
-        shutdown_info = get_shutdown_info(config, self.manager_config)
+        clean = was_clean_shutdown(
+            config, self.manager_config, self._marker_cache
+        )
+        shutdown_info = get_shutdown_info(
+            config, self.manager_config, self._marker_cache
+        )
 
         status = {
             "clean_shutdown": clean,
@@ -8,13 +8,34 @@ The marker file approach:
 If marker is missing on startup, it indicates a crash (marker was never written).
 """
 
+import errno
 import json
+import os
+import secrets
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from ram_disk_manager.config import RamDiskConfig, ManagerConfig
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Parsed markers keyed by path, tagged with the (mtime_ns, size) they were read at
+MarkerCache = Dict[Path, Tuple[Tuple[int, int], Any]]
+
+# Linux can create an unnamed file and link it into place once written
+_HAS_TMPFILE = sys.platform.startswith("linux") and hasattr(os, "O_TMPFILE")
+
+# O_TMPFILE errors meaning the filesystem or kernel doesn't support it
+_TMPFILE_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL,
+})
+
 
 def _get_marker_path(config: RamDiskConfig, manager_config: Optional[ManagerConfig] = None) -> Path:
     """Get the path to the shutdown marker file.
@@ -36,9 +57,64 @@ def _get_marker_path(config: RamDiskConfig, manager_config: Optional[ManagerConf
     return config.disk_path / marker_name
 
 
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _load_marker(marker_path: Path, cache: Optional[MarkerCache] = None) -> Any:
+    """Parse the marker file, reusing a cached parse if the file is unchanged.
+
+    Args:
+        marker_path: Path to the marker file
+        cache: Optional cache to consult and update
+
+    Returns:
+        Parsed JSON content, or None if the marker is missing or unreadable
+    """
+    try:
+        st = os.stat(marker_path)
+    except OSError:
+        if cache is not None:
+            cache.pop(marker_path, None)
+        return None
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    if cache is not None:
+        cached = cache.get(marker_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    try:
+        with open(marker_path, "rb") as f:
+            raw = f.read().strip()
+        # Markers are JSON objects; reject anything else without parsing
+        if raw[:1] == b"{" and raw[-1:] == b"}":
+            data = _loads(raw)
+        else:
+            data = None
+    except (ValueError, OSError):
+        # Corrupted, non-UTF-8 or unreadable marker
+        data = None
+
+    if cache is not None:
+        cache[marker_path] = (stamp, data)
+    return data
+
+
 def was_clean_shutdown(
     config: RamDiskConfig,
-    manager_config: Optional[ManagerConfig] = None
+    manager_config: Optional[ManagerConfig] = None,
+    cache: Optional[MarkerCache] = None
 ) -> bool:
     """Check if the last shutdown was clean.
 
@@ -48,33 +124,83 @@ def was_clean_shutdown(
     Args:
         config: RAM disk configuration
         manager_config: Optional manager config for marker filename
+        cache: Optional cache of parsed markers, reused while unchanged
 
     Returns:
         True if marker exists and is valid, False otherwise (indicates crash)
     """
-    marker_path = _get_marker_path(config, manager_config)
+    data = _load_marker(_get_marker_path(config, manager_config), cache)
 
-    if not marker_path.exists():
-        return False
+    # Missing, corrupted or malformed marker - treat as crash
+    return isinstance(data, dict) and bool(data.get("clean_shutdown", False))
 
-    try:
-        with open(marker_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
 
-        # Validate marker structure
-        if not isinstance(data, dict):
-            return False
-        if "clean_shutdown" not in data:
-            return False
-        if not data.get("clean_shutdown", False):
-            return False
+def _write_all(fd: int, payload: memoryview) -> None:
+    """Write the whole payload to fd, normally in a single call."""
+    while payload:
+        payload = payload[os.write(fd, payload):]
 
-        # Marker is valid
-        return True
 
-    except (json.JSONDecodeError, OSError, KeyError):
-        # Corrupted or unreadable marker - treat as crash
-        return False
+def _link_tmpfile(marker_path: Path, payload: memoryview) -> bool:
+    """Write the marker to an unnamed O_TMPFILE and publish it atomically.
+
+    The written file is linked under a unique temporary name in the
+    marker's directory and then renamed over the marker, so the marker
+    only ever appears complete and an existing marker is replaced
+    without a moment where none exists.
+
+    Args:
+        marker_path: Path to the marker file
+        payload: Encoded marker content
+
+    Returns:
+        True if the marker was written, False if O_TMPFILE (or the
+        /proc link it relies on) isn't available here
+    """
+    dir_fd = os.open(marker_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        try:
+            fd = os.open(".", os.O_TMPFILE | os.O_WRONLY, 0o644, dir_fd=dir_fd)
+        except OSError as e:
+            if e.errno in _TMPFILE_UNSUPPORTED_ERRNOS:
+                return False
+            raise
+
+        temp_name = f".{marker_path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+        try:
+            _write_all(fd, payload)
+            # A destination dir fd makes os.link use linkat(), which with
+            # follow_symlinks resolves the /proc entry to the open file
+            os.link(
+                f"/proc/self/fd/{fd}",
+                temp_name,
+                dst_dir_fd=dir_fd,
+                follow_symlinks=True,
+            )
+        except OSError as e:
+            if e.errno not in (errno.ENOENT, errno.EXDEV, errno.EPERM):
+                raise
+            # No /proc, or linkat can't follow it here
+            return False
+        finally:
+            os.close(fd)
+
+        try:
+            os.replace(
+                temp_name,
+                marker_path.name,
+                src_dir_fd=dir_fd,
+                dst_dir_fd=dir_fd,
+            )
+        except OSError:
+            try:
+                os.unlink(temp_name, dir_fd=dir_fd)
+            except OSError:
+                pass
+            raise
+    finally:
+        os.close(dir_fd)
+    return True
 
 
 def mark_clean_shutdown(
@@ -107,8 +233,21 @@ def mark_clean_shutdown(
             "ram_path": str(config.ram_path) if config.ram_path else None,
         }
 
-        with open(marker_path, "w", encoding="utf-8") as f:
-            json.dump(marker_data, f, indent=2)
+        # Encode up front and hand the kernel the whole payload at once,
+        # without a buffered file object around the descriptor
+        payload = memoryview(_dumps(marker_data))
+        if _HAS_TMPFILE and _link_tmpfile(marker_path, payload):
+            return True
+
+        fd = os.open(
+            marker_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        try:
+            _write_all(fd, payload)
+        finally:
+            os.close(fd)
 
         return True
 
@@ -148,24 +287,20 @@ def clear_shutdown_marker(
 
 def get_shutdown_info(
     config: RamDiskConfig,
-    manager_config: Optional[ManagerConfig] = None
+    manager_config: Optional[ManagerConfig] = None,
+    cache: Optional[MarkerCache] = None
 ) -> Optional[dict]:
     """Get information from the shutdown marker if it exists.
 
     Args:
         config: RAM disk configuration
         manager_config: Optional manager config for marker filename
+        cache: Optional cache of parsed markers, reused while unchanged
 
     Returns:
         Dict with marker info if valid, None otherwise
     """
-    marker_path = _get_marker_path(config, manager_config)
-
-    if not marker_path.exists():
-        return None
+    data = _load_marker(_get_marker_path(config, manager_config), cache)
 
-    try:
-        with open(marker_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+    # Hand out a copy so callers can't alter a cached parse
+    return dict(data) if isinstance(data, dict) else data
@@ -9,7 +9,18 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from ram_disk_manager.config import RamDiskConfig
-from ram_disk_manager.utils.hashing import fast_hash_file, hash_directory
+from ram_disk_manager.utils.hashing import (
+    BLAKE3_AVAILABLE,
+    fast_hash_file,
+    hash_files,
+    walk_pair,
+)
+
+# Corruption checks want a collision-resistant hash. BLAKE3 is SIMD-fast;
+# without it, sha256 runs through OpenSSL (SHA-NI where the CPU has it).
+# fast_hash_file() feeds either one from a reused per-thread buffer via
+# readinto, or, with use_mmap on a quiescent tree, maps large files whole
+INTEGRITY_ALGORITHM = "blake3" if BLAKE3_AVAILABLE else "sha256"
 
 
 @dataclass
@@ -22,8 +33,9 @@ class IntegrityResult:
         missing_in_ram: Files on disk but not in RAM
         missing_on_disk: Files in RAM but not on disk (unexpected)
         errors: Files that couldn't be verified due to errors
-        disk_hashes: Hash map of disk files
-        ram_hashes: Hash map of RAM files
+        disk_hashes: Hash map of disk files that were hashed
+        ram_hashes: Hash map of RAM files that were hashed
+        stat_verified: Files passed on matching size and mtime, not hashed
     """
     verified_count: int = 0
     mismatched_files: List[str] = field(default_factory=list)
@@ -32,6 +44,7 @@ class IntegrityResult:
     errors: List[str] = field(default_factory=list)
     disk_hashes: Dict[str, str] = field(default_factory=dict)
     ram_hashes: Dict[str, str] = field(default_factory=dict)
+    stat_verified: List[str] = field(default_factory=list)
 
     @property
     def is_valid(self) -> bool:
@@ -45,7 +58,7 @@ class IntegrityResult:
     @property
     def total_files(self) -> int:
         """Total number of files checked."""
-        return len(self.disk_hashes)
+        return len(self.disk_hashes) + len(self.stat_verified)
 
     @property
     def needs_recovery(self) -> bool:
@@ -68,7 +81,10 @@ class IntegrityResult:
 
 def verify_integrity(
     config: RamDiskConfig,
-    patterns: Optional[List[str]] = None
+    patterns: Optional[List[str]] = None,
+    algorithm: str = INTEGRITY_ALGORITHM,
+    quick: bool = True,
+    use_mmap: bool = False
 ) -> IntegrityResult:
     """Verify integrity between disk and RAM content.
 
@@ -78,9 +94,18 @@ def verify_integrity(
     - Extra files in RAM (not on disk - unusual)
     - Read errors
 
+    Syncs copy files with their mtime, so in quick mode a file whose size
+    and mtime match on both sides is counted as verified without being
+    read. Only the remaining files are hashed.
+
     Args:
         config: RAM disk configuration with disk_path and ram_path
         patterns: Optional glob patterns to filter files (uses config.patterns if None)
+        algorithm: Hash algorithm (default: blake3 if installed, else sha256)
+        quick: Trust matching size and mtime instead of hashing. Pass False
+               to hash every file, e.g. to catch in-place corruption.
+        use_mmap: Memory-map large files while hashing. Only safe when
+                  nothing is writing either tree (see fast_hash_file()).
 
     Returns:
         IntegrityResult with verification statistics
@@ -99,18 +124,47 @@ def verify_integrity(
     # Use provided patterns or config patterns
     check_patterns = patterns if patterns is not None else config.patterns
 
-    # Hash both directories
+    # Walk both trees together; files whose size and mtime match are
+    # taken as verified in quick mode, everything else gets hashed
+    disk_keys: List[str] = []
+    disk_paths: List[str] = []
+    ram_keys: List[str] = []
+    ram_paths: List[str] = []
     try:
-        result.disk_hashes = hash_directory(config.disk_path, check_patterns)
+        for rel_path, disk_file, ram_file in walk_pair(
+            config.disk_path, config.ram_path, check_patterns
+        ):
+            if (
+                quick
+                and disk_file is not None
+                and ram_file is not None
+                and ram_file[1].st_size == disk_file[1].st_size
+                and ram_file[1].st_mtime_ns == disk_file[1].st_mtime_ns
+            ):
+                result.stat_verified.append(rel_path)
+                continue
+            if disk_file is not None:
+                disk_keys.append(rel_path)
+                disk_paths.append(disk_file[0])
+            if ram_file is not None:
+                ram_keys.append(rel_path)
+                ram_paths.append(ram_file[0])
     except Exception as e:
-        result.errors.append(f"Failed to hash disk directory: {e}")
+        result.errors.append(f"Failed to scan directories: {e}")
         return result
+    result.verified_count = len(result.stat_verified)
 
-    try:
-        result.ram_hashes = hash_directory(config.ram_path, check_patterns)
-    except Exception as e:
-        result.errors.append(f"Failed to hash RAM directory: {e}")
-        return result
+    # Hash everything else on both sides in one batch
+    hashes = hash_files(disk_paths + ram_paths, algorithm, use_mmap=use_mmap)
+
+    # Unreadable files are left out, as hash_directory() does
+    count = len(disk_keys)
+    result.disk_hashes = {
+        key: h for key, h in zip(disk_keys, hashes[:count]) if h is not None
+    }
+    result.ram_hashes = {
+        key: h for key, h in zip(ram_keys, hashes[count:]) if h is not None
+    }
 
     # Compare hashes
     disk_files = set(result.disk_hashes.keys())
@@ -138,13 +192,15 @@ def verify_integrity(
 
 def verify_single_file(
     config: RamDiskConfig,
-    relative_path: str
+    relative_path: str,
+    algorithm: str = INTEGRITY_ALGORITHM
 ) -> dict:
     """Verify integrity of a single file.
 
     Args:
         config: RAM disk configuration
         relative_path: Path relative to disk_path/ram_path
+        algorithm: Hash algorithm (default: blake3 if installed, else sha256)
 
     Returns:
         Dict with verification result
@@ -164,10 +220,10 @@ def verify_single_file(
 
     try:
         if result["exists_on_disk"]:
-            result["disk_hash"] = fast_hash_file(disk_file)
+            result["disk_hash"] = fast_hash_file(disk_file, algorithm)
 
         if result["exists_in_ram"]:
-            result["ram_hash"] = fast_hash_file(ram_file)
+            result["ram_hash"] = fast_hash_file(ram_file, algorithm)
 
         result["match"] = (
             result["disk_hash"] is not None and
@@ -9,19 +9,285 @@ SyncEngine handles bidirectional synchronization:
 Uses hash-based change detection for incremental syncs.
 """
 
+import errno
+import io
 import json
+import os
 import shutil
+import stat
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Set, Tuple,
+    Union
+)
 import logging
 
 from ram_disk_manager.config import RamDiskConfig, SyncStrategy
-from ram_disk_manager.utils.hashing import fast_hash_file, hash_directory, compare_hashes
+from ram_disk_manager.utils.hashing import (
+    XXHASH_AVAILABLE,
+    hash_directory,
+    compile_patterns,
+    collect_files,
+    diff_directories,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Change detection only needs to tell files apart, not resist tampering;
+# 128-bit XXH3 does that at memory speed with no practical collisions.
+# Integrity verification keeps its own, stronger hash.
+FINGERPRINT_ALGORITHM = "xxh128" if XXHASH_AVAILABLE else "auto"
+
+# Largest single in-kernel copy request (16 MiB)
+_COPY_CHUNK = 1 << 24
+
+# Buffer for the userspace fallback copy (1 MiB)
+_COPY_BUFFER = 1 << 20
+
+# Fallback copy buffers, allocated once per thread and reused
+_copy_buffers = threading.local()
+
+# Same-size files at least this large are patched block by block
+_PATCH_MIN_SIZE = 1 << 20
+_PATCH_BLOCK = 1 << 16
+
+# The hash cache snapshot is rewritten once its log exceeds this fraction
+# of the snapshot's size
+_HASH_LOG_COMPACT_RATIO = 0.25
+
+# Errors meaning "the kernel can't do this copy here", not a real failure
+_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EBADF,
+})
+
+
+def _copy_file_range(infd: int, outfd: int, offset: int, count: int) -> int:
+    # Uses and advances both file positions
+    return os.copy_file_range(infd, outfd, count)
+
+
+def _sendfile(infd: int, outfd: int, offset: int, count: int) -> int:
+    # Reads from offset and writes at (and advances) the output position
+    return os.sendfile(outfd, infd, offset, count)
+
+
+_KERNEL_COPIERS = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIERS.append(_copy_file_range)
+if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+    _KERNEL_COPIERS.append(_sendfile)
+
+# Errors meaning the copier can't work on this filesystem at all
+_COPY_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP,
+})
+
+# Copiers found unsupported between a (source, destination) device pair.
+# Disk and a tmpfs RAM disk are different filesystems, so e.g.
+# copy_file_range fails with EXDEV for every file; later copies between
+# the same devices skip straight past it.
+_UNSUPPORTED_COPIERS: Dict[Tuple[int, int], Set[Callable[..., int]]] = {}
+
+
+def _make_parent_dirs(destinations: Iterable[str]) -> None:
+    """Create the distinct parent directories of destinations once each.
+    
+    Failures are ignored here; they surface as copy errors for the
+    affected files.
+    
+    Args:
+        destinations: Destination file paths
+    """
+    for parent in {os.path.dirname(dst) for dst in destinations}:
+        try:
+            os.makedirs(parent, exist_ok=True)
+        except OSError:
+            pass
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it's installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it's installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _copy_remaining(fsrc: io.BufferedReader, fdst: io.BufferedWriter) -> None:
+    """Copy the rest of fsrc to fdst through a reused buffer.
+
+    Unlike shutil.copyfileobj, which allocates a new bytes object for
+    every chunk, this reads into the calling thread's preallocated buffer.
+    """
+    buf = getattr(_copy_buffers, "buf", None)
+    if buf is None:
+        buf = _copy_buffers.buf = memoryview(bytearray(_COPY_BUFFER))
+    readinto = fsrc.readinto
+    write = fdst.write
+    while True:
+        n = readinto(buf)
+        if not n:
+            break
+        write(buf[:n])
+
+
+def _open_source(
+    src: Union[str, Path]
+) -> Tuple[io.BufferedReader, os.stat_result]:
+    """Open a copy source, refusing anything but a regular file.
+
+    The type is checked on the open descriptor, before any data is read,
+    so a FIFO or device in the tree can't stall a sync the way a blocking
+    open or read of it would.
+
+    Args:
+        src: Source file
+
+    Returns:
+        Binary file object and its fstat result
+
+    Raises:
+        shutil.SpecialFileError: If src isn't a regular file
+        OSError: If src can't be opened
+    """
+    # O_NONBLOCK keeps a FIFO from blocking the open; it has no effect
+    # on regular files
+    flags = (
+        os.O_RDONLY
+        | getattr(os, "O_BINARY", 0)
+        | getattr(os, "O_NONBLOCK", 0)
+    )
+    fd = os.open(src, flags)
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            raise shutil.SpecialFileError(f"Not a regular file: {src}")
+        return os.fdopen(fd, "rb"), st
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def _copy_file(src: Union[str, Path], dst: Union[str, Path]) -> int:
+    """Copy file data and metadata, keeping the data copy in-kernel.
+
+    Tries copy_file_range, then sendfile, and falls back to a regular
+    buffered copy when neither works for these files. Sources that aren't
+    regular files are rejected before anything is copied. A copier that
+    reports the filesystem can't support it is not tried again between
+    the same source and destination devices. Permissions and
+    timestamps are then set from the source's fstat, like copy2 but
+    without its extra stat and xattr calls.
+
+    Args:
+        src: Source file
+        dst: Destination file (overwritten)
+
+    Returns:
+        Number of bytes copied
+    """
+    fsrc, st = _open_source(src)
+    with fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        size = st.st_size
+        offset = 0
+        devices = (st.st_dev, os.fstat(outfd).st_dev)
+        unsupported = _UNSUPPORTED_COPIERS.get(devices, ())
+
+        for copier in _KERNEL_COPIERS:
+            if copier in unsupported:
+                continue
+            try:
+                while offset < size:
+                    sent = copier(
+                        infd, outfd, offset, min(size - offset, _COPY_CHUNK)
+                    )
+                    if sent == 0:
+                        break
+                    offset += sent
+                break
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+                if e.errno in _COPY_UNSUPPORTED_ERRNOS:
+                    _UNSUPPORTED_COPIERS.setdefault(devices, set()).add(copier)
+
+        if offset < size:
+            fsrc.seek(offset)
+            fdst.seek(offset)
+            _copy_remaining(fsrc, fdst)
+
+    # After close, so no buffered flush can bump the mtime again
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    return size
+
+
+def _patch_file(src: Union[str, Path], dst: Union[str, Path]) -> int:
+    """Rewrite only the blocks of dst that differ from src.
+
+    For large files edited in place, persisting a few changed KB then
+    costs a read of both copies but writes only the changed blocks,
+    instead of rewriting the whole file on disk. Files that differ in
+    size, or are too small to be worth it, are copied with _copy_file().
+
+    Args:
+        src: Source file
+        dst: Destination file
+
+    Returns:
+        Number of bytes written
+    """
+    size = os.stat(src).st_size
+    try:
+        same_size = os.stat(dst).st_size == size
+    except FileNotFoundError:
+        same_size = False
+    if not same_size or size < _PATCH_MIN_SIZE:
+        return _copy_file(src, dst)
+
+    written = 0
+    src_buf = bytearray(_PATCH_BLOCK)
+    dst_buf = bytearray(_PATCH_BLOCK)
+    with open(src, "rb") as fsrc, open(dst, "r+b") as fdst:
+        st = os.fstat(fsrc.fileno())
+        while True:
+            n = fsrc.readinto(src_buf)
+            if not n:
+                break
+            m = fdst.readinto(dst_buf)
+            if n == _PATCH_BLOCK:
+                same = m == n and src_buf == dst_buf
+            else:
+                same = m == n and src_buf[:n] == dst_buf[:n]
+            if not same:
+                fdst.seek(-m, os.SEEK_CUR)
+                fdst.write(memoryview(src_buf)[:n])
+                written += n
+        # Keep the patched file the exact length of the source
+        fdst.truncate()
+
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    return written
+
 
 @dataclass
 class SyncStats:
@@ -69,6 +335,10 @@ class SyncEngine:
     
     DISK IS TRUTH, RAM IS CACHE.
     
+    Owns a worker pool shared by all sync operations, started on first
+    use; call close() (or use the engine as a context manager) when done
+    with it.
+    
     Attributes:
         config: RamDiskConfig with paths and sync settings
         hash_cache_path: Path to store hash cache for incremental syncs
@@ -84,40 +354,246 @@ class SyncEngine:
         Args:
             config: Configuration for this RAM disk
             hash_cache_path: Where to store hash cache. 
-                           Defaults to disk_path/.ram_disk_hashes.json
+                           Defaults to disk_path/.ram_disk_hashes.json.
+                           Changes since the last snapshot go to a
+                           sidecar file with ".log" appended. Neither
+                           file is ever synced.
         """
         self.config = config
         self.disk_path = Path(config.disk_path)
         self.ram_path = Path(config.ram_path) if config.ram_path else None
         
+        # Sync patterns compiled once, matched by name in a single tree walk
+        self._pattern_re = compile_patterns(config.patterns)
+        
+        # One bounded pool reused by every sync, so hashing and copying
+        # never spin up threads per call or oversubscribe the CPU. Started
+        # on first use, so engines that never hash start no threads.
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        
         # Hash cache lives on DISK (truth) so it survives RAM loss
         self.hash_cache_path = hash_cache_path or (
             self.disk_path / ".ram_disk_hashes.json"
         )
         
-        # In-memory hash cache
+        # Changes since the last snapshot are appended to a sidecar log
+        self.hash_log_path = self.hash_cache_path.with_name(
+            self.hash_cache_path.name + ".log"
+        )
+        
+        # The cache files sit in disk_path by default but aren't user data;
+        # every walk leaves them out by relative path
+        self._internal_files = self._relative_keys(
+            self.hash_cache_path, self.hash_log_path
+        )
+        
+        # In-memory hash cache; dirty until it matches the files on disk
         self._hash_cache: Dict[str, str] = {}
+        self._hash_cache_dirty = True
+        self._hash_snapshot_size = 0
+        self._hash_log_size = 0
         self._load_hash_cache()
     
+    def _executor(self) -> ThreadPoolExecutor:
+        """Return the engine's worker pool, starting it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=max(4, (os.cpu_count() or 4) * 2),
+                    thread_name_prefix="sync"
+                )
+            return self._pool
+    
+    def close(self) -> None:
+        """Shut down the worker pool, if started, waiting for pending work."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
+    def __enter__(self) -> "SyncEngine":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _relative_keys(self, *paths: Path) -> Set[str]:
+        """Relative keys, as used in hash maps, of paths under disk_path.
+        
+        Args:
+            paths: Paths to convert; those outside disk_path are dropped
+            
+        Returns:
+            Forward-slash relative paths
+        """
+        keys: Set[str] = set()
+        for path in paths:
+            try:
+                relative = Path(path).relative_to(self.disk_path)
+            except ValueError:
+                continue
+            keys.add(str(relative).replace("\\", "/"))
+        return keys
+    
     def _load_hash_cache(self) -> None:
-        """Load hash cache from disk."""
-        if self.hash_cache_path.exists():
+        """Load the hash cache snapshot from disk and replay its log."""
+        if not self.hash_cache_path.exists():
+            return
+        try:
+            with open(self.hash_cache_path, "rb") as f:
+                data = f.read()
+            self._hash_cache = _loads(data)
+            self._hash_snapshot_size = len(data)
+            self._hash_cache_dirty = False
+        except (ValueError, OSError) as e:
+            logger.warning("Failed to load hash cache: %s", e)
+            self._hash_cache = {}
+            return
+        
+        try:
+            with open(self.hash_log_path, "rb") as f:
+                log = f.read()
+        except FileNotFoundError:
+            log = b""
+        except OSError as e:
+            logger.warning("Failed to read hash cache log: %s", e)
+            log = b""
+            self._hash_cache_dirty = True
+        self._hash_log_size = len(log)
+        
+        for line in log.splitlines():
             try:
-                with open(self.hash_cache_path, "r") as f:
-                    self._hash_cache = json.load(f)
-                logger.debug(f"Loaded hash cache with {len(self._hash_cache)} entries")
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning(f"Failed to load hash cache: {e}")
-                self._hash_cache = {}
+                record = _loads(line)
+                if record["op"] == "upsert":
+                    self._hash_cache[record["path"]] = record["hash"]
+                else:
+                    self._hash_cache.pop(record["path"], None)
+            except (ValueError, KeyError, TypeError):
+                # A torn final append; compact on the next save
+                self._hash_cache_dirty = True
+                break
+        logger.debug("Loaded hash cache with %d entries", len(self._hash_cache))
     
     def _save_hash_cache(self) -> None:
-        """Save hash cache to disk."""
+        """Write a fresh hash cache snapshot if it is dirty.
+
+        The whole cache is serialized compactly up front and written with
+        a single write call. The log is removed first, since every entry
+        in it is already part of the new snapshot.
+        """
+        if not self._hash_cache_dirty:
+            return
+        payload = _dumps(self._hash_cache)
+        try:
+            self.hash_log_path.unlink(missing_ok=True)
+            self._hash_log_size = 0
+            with open(self.hash_cache_path, "wb") as f:
+                f.write(payload)
+            self._hash_snapshot_size = len(payload)
+            self._hash_cache_dirty = False
+            logger.debug("Saved hash cache with %d entries", len(self._hash_cache))
+        except OSError as e:
+            logger.warning("Failed to save hash cache: %s", e)
+    
+    def _update_hash_cache(self, hashes: Dict[str, str]) -> None:
+        """Replace the hash cache and persist what changed.
+        
+        Changed and removed entries are appended to the log in one write,
+        so a sync costs a write proportional to what it touched rather
+        than to the whole cache. The snapshot is rewritten instead when
+        the log would grow past a quarter of its size.
+        
+        Args:
+            hashes: Fresh hash map of the disk directory
+        """
+        previous = self._hash_cache
+        self._hash_cache = hashes
+        if self._hash_cache_dirty:
+            self._save_hash_cache()
+            return
+        
+        records = [
+            {"op": "upsert", "path": path, "hash": digest}
+            for path, digest in hashes.items()
+            if previous.get(path) != digest
+        ]
+        records += [
+            {"op": "delete", "path": path}
+            for path in previous.keys() - hashes.keys()
+        ]
+        if not records:
+            return
+        
+        payload = b"".join(_dumps(record) + b"\n" for record in records)
+        if (
+            self._hash_log_size + len(payload)
+            > self._hash_snapshot_size * _HASH_LOG_COMPACT_RATIO
+        ):
+            self._hash_cache_dirty = True
+            self._save_hash_cache()
+            return
+        
         try:
-            with open(self.hash_cache_path, "w") as f:
-                json.dump(self._hash_cache, f, indent=2)
-            logger.debug(f"Saved hash cache with {len(self._hash_cache)} entries")
+            with open(self.hash_log_path, "ab") as f:
+                f.write(payload)
+            self._hash_log_size += len(payload)
         except OSError as e:
-            logger.warning(f"Failed to save hash cache: {e}")
+            logger.warning("Failed to append to hash cache log: %s", e)
+            self._hash_cache_dirty = True
+    
+    def _hash_directory(self, directory: Path) -> Dict[str, str]:
+        """Hash files in directory matching the configured patterns.
+        
+        Args:
+            directory: Directory to hash
+            
+        Returns:
+            Dict mapping relative paths to hashes
+        """
+        hashes = hash_directory(
+            directory,
+            self.config.patterns,
+            FINGERPRINT_ALGORITHM,
+            pattern_re=self._pattern_re,
+            executor=self._executor()
+        )
+        for key in self._internal_files:
+            hashes.pop(key, None)
+        return hashes
+    
+    def _diff(
+        self,
+        source: Path,
+        target: Path,
+        trust_mtime: bool = False
+    ) -> Dict[str, list]:
+        """Diff two directories, hashing only same-size files.
+        
+        Args:
+            source: Source directory
+            target: Target directory
+            trust_mtime: Skip hashing pairs whose size and mtime match
+            
+        Returns:
+            Diff dict as returned by compare_hashes()
+        """
+        diff = diff_directories(
+            source,
+            target,
+            self.config.patterns,
+            FINGERPRINT_ALGORITHM,
+            pattern_re=self._pattern_re,
+            executor=self._executor(),
+            trust_mtime=trust_mtime
+        )
+        if self._internal_files:
+            internal = self._internal_files
+            diff = {
+                kind: [key for key in keys if key not in internal]
+                for kind, keys in diff.items()
+            }
+        return diff
     
     def disk_to_ram(self, force_full: bool = False) -> SyncStats:
         """Sync from disk (truth) to RAM (cache).
@@ -161,11 +637,7 @@ class SyncEngine:
         
         # Update hash cache after successful sync
         if stats.success:
-            self._hash_cache = hash_directory(
-                self.disk_path, 
-                self.config.patterns
-            )
-            self._save_hash_cache()
+            self._update_hash_cache(self._hash_directory(self.disk_path))
         
         return self._finalize_stats(stats)
     
@@ -196,46 +668,58 @@ class SyncEngine:
         # Ensure disk path exists
         self.disk_path.mkdir(parents=True, exist_ok=True)
         
-        # Get current state of both
-        ram_hashes = hash_directory(self.ram_path, self.config.patterns)
-        disk_hashes = hash_directory(self.disk_path, self.config.patterns)
+        # Compare current state of both to find changes
+        diff = self._diff(self.ram_path, self.disk_path)
+        
+        # Copy new and modified files from RAM to disk. Plain strings
+        # keep Path construction out of the per-file loop.
+        ram_str = str(self.ram_path)
+        disk_str = str(self.disk_path)
+        join = os.path.join
+        copies = [
+            (rel_path, join(ram_str, rel_path), join(disk_str, rel_path))
+            for rel_path in diff["added"] + diff["modified"]
+        ]
+        _make_parent_dirs(dst for _, _, dst in copies)
+        
+        # Incremental mode patches modified files in place on disk
+        patchable = (
+            set(diff["modified"])
+            if self.config.sync_strategy == SyncStrategy.INCREMENTAL
+            else set()
+        )
         
-        # Compare to find changes
-        diff = compare_hashes(ram_hashes, disk_hashes)
+        # Loop-invariant lookups bound to locals
+        copy_file = _copy_file
+        patch_file = _patch_file
+        unlink = os.unlink
+        add_error = stats.errors.append
         
-        # Copy new and modified files from RAM to disk
-        for rel_path in diff["added"] + diff["modified"]:
-            src = self.ram_path / rel_path
-            dst = self.disk_path / rel_path
-            
+        for rel_path, src, dst in copies:
             try:
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
+                if rel_path in patchable:
+                    stats.bytes_copied += patch_file(src, dst)
+                else:
+                    stats.bytes_copied += copy_file(src, dst)
                 stats.files_copied += 1
-                stats.bytes_copied += src.stat().st_size
             except OSError as e:
                 stats.files_failed += 1
-                stats.errors.append(f"Failed to copy {rel_path}: {e}")
+                add_error(f"Failed to copy {rel_path}: {e}")
         
         # Delete files from disk that were removed from RAM
         for rel_path in diff["removed"]:
-            dst = self.disk_path / rel_path
             try:
-                dst.unlink()
+                unlink(join(disk_str, rel_path))
                 stats.files_deleted += 1
             except OSError as e:
                 stats.files_failed += 1
-                stats.errors.append(f"Failed to delete {rel_path}: {e}")
+                add_error(f"Failed to delete {rel_path}: {e}")
         
         stats.files_unchanged = len(diff["unchanged"])
         
         # Update hash cache
         if stats.files_failed == 0:
-            self._hash_cache = hash_directory(
-                self.disk_path, 
-                self.config.patterns
-            )
-            self._save_hash_cache()
+            self._update_hash_cache(self._hash_directory(self.disk_path))
         else:
             stats.success = False
         
@@ -250,43 +734,51 @@ class SyncEngine:
         Returns:
             Updated stats
         """
-        # Clear RAM directory
+        # Clear RAM directory, using the entry types scandir already read
         if self.ram_path.exists():
-            for item in self.ram_path.iterdir():
-                try:
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-                    stats.files_deleted += 1
-                except OSError as e:
-                    stats.errors.append(f"Failed to delete {item}: {e}")
+            with os.scandir(self.ram_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+                        stats.files_deleted += 1
+                    except OSError as e:
+                        stats.errors.append(f"Failed to delete {entry.path}: {e}")
         else:
             self.ram_path.mkdir(parents=True, exist_ok=True)
         
         # Copy all matching files from disk
-        files_to_copy = set()
-        for pattern in self.config.patterns:
-            if "**" in pattern:
-                matched = self.disk_path.glob(pattern)
-            else:
-                matched = self.disk_path.rglob(pattern)
-            
-            for path in matched:
-                if path.is_file():
-                    files_to_copy.add(path)
+        files_to_copy = collect_files(
+            self.disk_path,
+            self.config.patterns,
+            self._pattern_re
+        )
         
+        # Path normalizes away a leading "./", so the collected paths may
+        # not start with str(disk_path); take the relative part properly
+        disk_path = self.disk_path
+        ram_str = str(self.ram_path)
+        join = os.path.join
+        internal = self._internal_files
+        copies: List[Tuple[Path, str]] = []
         for src in files_to_copy:
+            rel_path = str(src.relative_to(disk_path))
+            if rel_path.replace("\\", "/") in internal:
+                continue
+            copies.append((src, join(ram_str, rel_path)))
+        _make_parent_dirs(dst for _, dst in copies)
+        
+        copy_file = _copy_file
+        add_error = stats.errors.append
+        for src, dst in copies:
             try:
-                rel_path = src.relative_to(self.disk_path)
-                dst = self.ram_path / rel_path
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
+                stats.bytes_copied += copy_file(src, dst)
                 stats.files_copied += 1
-                stats.bytes_copied += src.stat().st_size
             except OSError as e:
                 stats.files_failed += 1
-                stats.errors.append(f"Failed to copy {src}: {e}")
+                add_error(f"Failed to copy {src}: {e}")
         
         if stats.files_failed > 0:
             stats.success = False
@@ -302,48 +794,41 @@ class SyncEngine:
         Returns:
             Updated stats
         """
-        # Hash current disk state
-        current_disk_hashes = hash_directory(
-            self.disk_path, 
-            self.config.patterns
-        )
-        
-        # Hash current RAM state (if exists)
-        if self.ram_path.exists():
-            current_ram_hashes = hash_directory(
-                self.ram_path, 
-                self.config.patterns
-            )
-        else:
-            self.ram_path.mkdir(parents=True, exist_ok=True)
-            current_ram_hashes = {}
-        
-        # Compare disk to RAM
-        diff = compare_hashes(current_disk_hashes, current_ram_hashes)
+        # Compare disk to current RAM state (creating RAM dir if missing)
+        self.ram_path.mkdir(parents=True, exist_ok=True)
+        diff = self._diff(self.disk_path, self.ram_path)
         
         # Copy new and modified files
-        for rel_path in diff["added"] + diff["modified"]:
-            src = self.disk_path / rel_path
-            dst = self.ram_path / rel_path
-            
+        ram_str = str(self.ram_path)
+        disk_str = str(self.disk_path)
+        join = os.path.join
+        copies = [
+            (rel_path, join(disk_str, rel_path), join(ram_str, rel_path))
+            for rel_path in diff["added"] + diff["modified"]
+        ]
+        _make_parent_dirs(dst for _, _, dst in copies)
+        
+        # Loop-invariant lookups bound to locals
+        copy_file = _copy_file
+        unlink = os.unlink
+        add_error = stats.errors.append
+        
+        for rel_path, src, dst in copies:
             try:
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
+                stats.bytes_copied += copy_file(src, dst)
                 stats.files_copied += 1
-                stats.bytes_copied += src.stat().st_size
             except OSError as e:
                 stats.files_failed += 1
-                stats.errors.append(f"Failed to copy {rel_path}: {e}")
+                add_error(f"Failed to copy {rel_path}: {e}")
         
         # Delete files from RAM that no longer exist on disk
         for rel_path in diff["removed"]:
-            dst = self.ram_path / rel_path
             try:
-                dst.unlink()
+                unlink(join(ram_str, rel_path))
                 stats.files_deleted += 1
             except OSError as e:
                 stats.files_failed += 1
-                stats.errors.append(f"Failed to delete {rel_path}: {e}")
+                add_error(f"Failed to delete {rel_path}: {e}")
         
         stats.files_unchanged = len(diff["unchanged"])
         
@@ -362,17 +847,14 @@ class SyncEngine:
         Returns:
             True if all files match, False otherwise
         """
-        source_hashes = hash_directory(source, self.config.patterns)
-        target_hashes = hash_directory(target, self.config.patterns)
-        
-        diff = compare_hashes(source_hashes, target_hashes)
+        diff = self._diff(source, target)
         
         if diff["added"] or diff["removed"] or diff["modified"]:
             logger.warning(
-                f"Verification failed: "
-                f"{len(diff['added'])} added, "
-                f"{len(diff['removed'])} removed, "
-                f"{len(diff['modified'])} modified"
+                "Verification failed: %d added, %d removed, %d modified",
+                len(diff["added"]),
+                len(diff["removed"]),
+                len(diff["modified"]),
             )
             return False
         
@@ -391,12 +873,15 @@ class SyncEngine:
         stats.duration_ms = (stats.completed_at - stats.started_at) * 1000
         
         logger.info(
-            f"Sync {stats.direction} ({stats.strategy}): "
-            f"{stats.files_copied} copied, "
-            f"{stats.files_deleted} deleted, "
-            f"{stats.files_unchanged} unchanged, "
-            f"{stats.files_failed} failed "
-            f"in {stats.duration_ms:.1f}ms"
+            "Sync %s (%s): %d copied, %d deleted, %d unchanged, "
+            "%d failed in %.1fms",
+            stats.direction,
+            stats.strategy,
+            stats.files_copied,
+            stats.files_deleted,
+            stats.files_unchanged,
+            stats.files_failed,
+            stats.duration_ms,
         )
         
         return stats
@@ -419,18 +904,17 @@ class SyncEngine:
         if not result["disk_exists"] or not result["ram_exists"]:
             return result
         
-        disk_hashes = hash_directory(self.disk_path, self.config.patterns)
-        ram_hashes = hash_directory(self.ram_path, self.config.patterns)
-        
-        diff = compare_hashes(disk_hashes, ram_hashes)
+        # Syncs preserve mtimes, so a status report can trust matching
+        # size and mtime and only hash the pairs that disagree
+        diff = self._diff(self.disk_path, self.ram_path, trust_mtime=True)
         
         result["in_sync"] = not (
             diff["added"] or diff["removed"] or diff["modified"]
         )
         result["differences"] = {
-            "disk_only": diff["added"],
-            "ram_only": diff["removed"],
-            "modified": diff["modified"],
+            "disk_only": sorted(diff["added"]),
+            "ram_only": sorted(diff["removed"]),
+            "modified": sorted(diff["modified"]),
             "identical": len(diff["unchanged"]),
         }
         
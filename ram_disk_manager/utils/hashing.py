@@ -1,12 +1,26 @@
 """Fast file and directory hashing utilities.
 
-Uses xxhash for speed when available, falls back to md5.
+Uses xxhash (XXH3) for speed when available, falls back to md5.
+BLAKE3 is available as an option when the blake3 package is installed.
 Designed for sync operations where speed matters more than cryptographic security.
 """
 
+import fnmatch
+import functools
 import hashlib
+import io
+import mmap
+import os
+import re
+import stat
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Optional
+from typing import (
+    Any, Callable, Dict, Iterator, List, Optional, Pattern,
+    Protocol, Sequence, Set, Tuple, Union
+)
 
 try:
     import xxhash
@@ -14,17 +28,115 @@ try:
 except ImportError:
     XXHASH_AVAILABLE = False
 
-# Buffer size for file reading (64KB is good for most filesystems)
-BUFFER_SIZE = 65536
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Size of the per-thread read buffer. Files smaller than MMAP_THRESHOLD
+# fit in a single read; a multiple of every common filesystem block size.
+BUFFER_SIZE = 1 << 20
+
+# Files at least this large are memory-mapped and hashed in a single update
+MMAP_THRESHOLD = 1 << 20
+
+# Linux-only: skip atime updates when reading files just to hash them
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Batches this small are hashed inline rather than handed to a thread pool
+SMALL_BATCH_SIZE = 2
+
+# Read buffers reused across files, one per hashing thread
+_buffers = threading.local()
+
+
+class _Hasher(Protocol):
+    """The part of the hashlib interface used here (xxhash, blake3 too)."""
+
+    def update(self, data: Any, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
 
 
-def fast_hash_file(file_path: Path, algorithm: str = "auto") -> str:
+# Hasher constructors by algorithm name, resolved once at import
+_ALGO_MAP: Dict[str, Callable[[], _Hasher]] = {
+    "md5": hashlib.md5,
+    "sha256": hashlib.sha256,
+    "blake2b": hashlib.blake2b,
+}
+if XXHASH_AVAILABLE:
+    _ALGO_MAP["xxhash"] = xxhash.xxh3_64
+    _ALGO_MAP["xxh128"] = xxhash.xxh3_128
+if BLAKE3_AVAILABLE:
+    _ALGO_MAP["blake3"] = blake3.blake3
+_ALGO_MAP["auto"] = _ALGO_MAP.get("xxhash", hashlib.md5)
+
+# A file found by a tree walk: its path string and stat result
+FileStat = Tuple[str, os.stat_result]
+
+
+def _open_for_hashing(file_path: Union[str, Path]) -> io.FileIO:
+    """Open a file for a single sequential read.
+
+    Uses O_NOATIME and POSIX_FADV_SEQUENTIAL where the platform supports
+    them, so hashing doesn't dirty inode metadata and gets a larger
+    kernel readahead window.
+
+    Args:
+        file_path: Path to the file to open
+
+    Returns:
+        Unbuffered binary file object
+    """
+    # O_NONBLOCK keeps a FIFO from blocking the open; it has no effect
+    # on regular files
+    flags = (
+        os.O_RDONLY
+        | getattr(os, "O_BINARY", 0)
+        | getattr(os, "O_NONBLOCK", 0)
+    )
+    try:
+        fd = os.open(file_path, flags | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        # O_NOATIME is only allowed for the file owner (or root)
+        fd = os.open(file_path, flags)
+
+    if _HAS_FADVISE:
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+    try:
+        return os.fdopen(fd, "rb", buffering=0)
+    except OSError:
+        # e.g. IsADirectoryError; don't leak the descriptor
+        os.close(fd)
+        raise
+
+
+def fast_hash_file(
+    file_path: Union[str, Path],
+    algorithm: str = "auto",
+    use_mmap: bool = False
+) -> str:
     """Compute a fast hash of a file.
 
     Args:
         file_path: Path to the file to hash
-        algorithm: Hash algorithm ("auto", "xxhash", "md5", "sha256")
+        algorithm: Hash algorithm ("auto", "xxhash", "xxh128", "blake3",
+                   "md5", "sha256", "blake2b")
                    "auto" uses xxhash if available, else md5
+        use_mmap: Memory-map files of at least MMAP_THRESHOLD bytes and
+                  hash them in one call. Only for files nothing is
+                  writing: if a mapped file is truncated mid-hash (as
+                  SQLite does to its -wal on checkpoint), touching the
+                  lost pages raises SIGBUS and kills the process, where
+                  a plain read just comes up short.
 
     Returns:
         Hex digest of the file hash
@@ -32,47 +144,248 @@ def fast_hash_file(file_path: Path, algorithm: str = "auto") -> str:
     Raises:
         FileNotFoundError: If file doesn't exist
         PermissionError: If file can't be read
+        ValueError: If the path isn't a regular file
     """
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    if not file_path.is_file():
-        raise ValueError(f"Not a file: {file_path}")
-
     # Select hasher
-    if algorithm == "auto":
-        if XXHASH_AVAILABLE:
-            hasher = xxhash.xxh64()
-        else:
-            hasher = hashlib.md5()
-    elif algorithm == "xxhash":
-        if not XXHASH_AVAILABLE:
+    constructor = _ALGO_MAP.get(algorithm)
+    if constructor is None:
+        if algorithm in ("xxhash", "xxh128"):
             raise ImportError("xxhash not installed. Install with: pip install xxhash")
-        hasher = xxhash.xxh64()
-    elif algorithm == "md5":
-        hasher = hashlib.md5()
-    elif algorithm == "sha256":
-        hasher = hashlib.sha256()
-    else:
+        if algorithm == "blake3":
+            raise ImportError("blake3 not installed. Install with: pip install blake3")
         raise ValueError(f"Unknown algorithm: {algorithm}")
 
-    # Read and hash in chunks
-    with open(file_path, "rb") as f:
+    # Open first and check the descriptor, rather than spending two
+    # extra stat calls per file on exists() and is_file()
+    try:
+        f = _open_for_hashing(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    except IsADirectoryError:
+        raise ValueError(f"Not a file: {file_path}") from None
+    except PermissionError:
+        # Windows refuses to open directories at all
+        if os.path.isdir(file_path):
+            raise ValueError(f"Not a file: {file_path}") from None
+        raise
+
+    with f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            raise ValueError(f"Not a file: {file_path}")
+
+        if use_mmap and st.st_size >= MMAP_THRESHOLD:
+            # Let the hash's C code stream through the mapping in one call
+            hasher = constructor()
+            if hasattr(hasher, "update_mmap"):
+                # blake3 maps the file itself and hashes it with SIMD
+                hasher.update_mmap(file_path)
+                return hasher.hexdigest()
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Truncated since fstat, or the filesystem can't map files;
+                # fall through to a plain read
+                mm = None
+            if mm is not None:
+                with mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mm)
+                return hasher.hexdigest()
+
+        # Read and hash in chunks through this thread's reusable buffer
+        hasher = constructor()
+        buf = _read_buffer()
+        readinto = f.readinto
         while True:
-            data = f.read(BUFFER_SIZE)
-            if not data:
+            n = readinto(buf)
+            if not n:
                 break
-            hasher.update(data)
+            hasher.update(buf[:n])
 
     return hasher.hexdigest()
 
 
+def _read_buffer() -> memoryview:
+    """Return the calling thread's read buffer, allocating it on first use."""
+    buf = getattr(_buffers, "buf", None)
+    if buf is None:
+        buf = _buffers.buf = memoryview(bytearray(BUFFER_SIZE))
+    return buf
+
+
+def _hash_or_none(
+    file_path: Union[str, Path],
+    algorithm: str,
+    use_mmap: bool = False
+) -> Optional[str]:
+    """Hash a file, returning None if it can't be read."""
+    try:
+        return fast_hash_file(file_path, algorithm, use_mmap)
+    except (PermissionError, OSError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_executor() -> ThreadPoolExecutor:
+    """Shared pool for callers that don't supply their own executor.
+
+    Hashing is I/O-bound and hashlib releases the GIL while digesting,
+    so threads overlap both the reads and the hashing itself.
+    """
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash")
+
+
+def hash_files(
+    paths: Sequence[Union[str, Path]],
+    algorithm: str = "auto",
+    executor: Optional[Executor] = None,
+    use_mmap: bool = False
+) -> List[Optional[str]]:
+    """Hash a batch of files, concurrently unless the batch is tiny.
+
+    Args:
+        paths: Files to hash
+        algorithm: Hash algorithm to use
+        executor: Executor to hash files concurrently (default: a shared
+                  thread pool; batches of two or fewer are hashed inline)
+        use_mmap: Map large files; only for files nothing is writing
+                  (see fast_hash_file())
+
+    Returns:
+        Hex digests in the same order as paths, None for unreadable files
+    """
+    if len(paths) <= SMALL_BATCH_SIZE:
+        return [_hash_or_none(path, algorithm, use_mmap) for path in paths]
+    if executor is None:
+        executor = _default_executor()
+    return list(executor.map(
+        _hash_or_none, paths, repeat(algorithm), repeat(use_mmap)
+    ))
+
+
+def _is_path_pattern(pattern: str) -> bool:
+    """Whether a glob pattern has to match a relative path, not a name.
+
+    Patterns with "**" or a directory part (e.g. "sub/*.txt") can't be
+    checked against a file name alone; they are globbed instead.
+    """
+    return "**" in pattern or "/" in pattern or os.sep in pattern
+
+
+def _glob_path_pattern(directory: Path, pattern: str) -> Iterator[Path]:
+    """Glob a path pattern under directory.
+
+    "**" patterns are anchored at directory; other patterns with a
+    directory part match at any depth, like rglob.
+    """
+    if "**" in pattern:
+        return directory.glob(pattern)
+    return directory.rglob(pattern)
+
+
+def compile_patterns(patterns: Optional[list] = None) -> Optional[Pattern[str]]:
+    """Combine simple glob patterns into a single file-name regex.
+
+    Patterns containing "**" or a directory part are path-relative and
+    are left to collect_files() to glob separately.
+
+    Args:
+        patterns: Glob patterns (default: ["*"] for all)
+
+    Returns:
+        Compiled regex matching any simple pattern, or None if there are none
+    """
+    simple = [p for p in (patterns or ["*"]) if not _is_path_pattern(p)]
+    if not simple:
+        return None
+
+    # Match glob's case-insensitivity on Windows
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile("|".join(fnmatch.translate(p) for p in simple), flags)
+
+
+def _scan_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for every non-directory below root.
+
+    Depth-first walk over os.scandir that works on plain strings and uses
+    the file type cached by scandir, so no Path or stat call is made for
+    directories. Like os.walk, symlinked directories are not followed and
+    unreadable directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield entry
+                    elif not entry.is_symlink():
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
+def collect_files(
+    directory: Path,
+    patterns: Optional[list] = None,
+    pattern_re: Optional[Pattern[str]] = None
+) -> Set[Path]:
+    """Collect files under a directory that match any of the given patterns.
+
+    Simple patterns are matched against file names at any depth in a single
+    scandir walk, instead of one recursive glob per pattern.
+
+    Args:
+        directory: Directory to search
+        patterns: Glob patterns to filter files (default: ["*"] for all)
+        pattern_re: Precompiled regex from compile_patterns(patterns)
+
+    Returns:
+        Set of matching regular file paths
+    """
+    patterns = patterns or ["*"]
+    if pattern_re is None:
+        pattern_re = compile_patterns(patterns)
+
+    files: Set[Path] = set()
+
+    if pattern_re is not None:
+        match = pattern_re.match
+        for entry in _scan_files(os.fspath(directory)):
+            if not match(entry.name):
+                continue
+            # Follows symlinks, so dangling links and special files are
+            # left out, as with Path.is_file()
+            try:
+                is_file = entry.is_file()
+            except OSError:
+                is_file = False
+            if is_file:
+                files.add(Path(entry.path))
+
+    # Path patterns are relative to the directory, so glob them as-is
+    for pattern in patterns:
+        if _is_path_pattern(pattern):
+            for path in _glob_path_pattern(directory, pattern):
+                if path.is_file():
+                    files.add(path)
+
+    return files
+
+
 def hash_directory(
     directory: Path,
     patterns: Optional[list] = None,
-    algorithm: str = "auto"
+    algorithm: str = "auto",
+    pattern_re: Optional[Pattern[str]] = None,
+    executor: Optional[Executor] = None
 ) -> Dict[str, str]:
     """Hash all files in a directory, returning relative path -> hash mapping.
 
@@ -80,6 +393,9 @@ def hash_directory(
         directory: Directory to hash
         patterns: Glob patterns to filter files (default: ["*"] for all)
         algorithm: Hash algorithm to use
+        pattern_re: Precompiled regex from compile_patterns(patterns)
+        executor: Executor to hash files concurrently (default: a shared
+                  thread pool; batches of two or fewer are hashed inline)
 
     Returns:
         Dict mapping relative file paths (as strings) to their hashes
@@ -87,43 +403,69 @@ def hash_directory(
     Raises:
         FileNotFoundError: If directory doesn't exist
     """
-    directory = Path(directory)
+    return hash_directories(
+        [directory], patterns, algorithm, pattern_re, executor
+    )[0]
 
-    if not directory.exists():
-        raise FileNotFoundError(f"Directory not found: {directory}")
 
-    if not directory.is_dir():
-        raise ValueError(f"Not a directory: {directory}")
+def hash_directories(
+    directories: List[Path],
+    patterns: Optional[list] = None,
+    algorithm: str = "auto",
+    pattern_re: Optional[Pattern[str]] = None,
+    executor: Optional[Executor] = None
+) -> List[Dict[str, str]]:
+    """Hash several directories as one batch.
 
-    patterns = patterns or ["*"]
-    result: Dict[str, str] = {}
+    Files from every directory go to the executor together, so the pool
+    stays busy across directories instead of draining between them.
 
-    # Collect files matching any pattern
-    files_to_hash = set()
-    for pattern in patterns:
-        # Handle recursive patterns
-        if "**" in pattern:
-            matched = directory.glob(pattern)
-        else:
-            # For simple patterns, search recursively
-            matched = directory.rglob(pattern)
+    Args:
+        directories: Directories to hash
+        patterns: Glob patterns to filter files (default: ["*"] for all)
+        algorithm: Hash algorithm to use
+        pattern_re: Precompiled regex from compile_patterns(patterns)
+        executor: Executor to hash files concurrently (default: a shared
+                  thread pool; batches of two or fewer are hashed inline)
+
+    Returns:
+        One hash_directory()-style mapping per directory, in order
+
+    Raises:
+        FileNotFoundError: If a directory doesn't exist
+    """
+    directories = [Path(directory) for directory in directories]
+    for directory in directories:
+        _check_directory(directory)
+
+    if pattern_re is None:
+        pattern_re = compile_patterns(patterns)
 
-        for path in matched:
-            if path.is_file():
-                files_to_hash.add(path)
+    # Collect files matching any pattern
+    batches = [
+        sorted(collect_files(directory, patterns, pattern_re))
+        for directory in directories
+    ]
 
     # Hash all matched files
-    for file_path in sorted(files_to_hash):
-        try:
+    hashes = iter(hash_files(
+        [path for batch in batches for path in batch], algorithm, executor
+    ))
+
+    results: List[Dict[str, str]] = []
+    for directory, paths in zip(directories, batches):
+        result: Dict[str, str] = {}
+        for file_path, file_hash in zip(paths, hashes):
+            if file_hash is None:
+                # Skip files we can't read
+                continue
             relative_path = file_path.relative_to(directory)
             # Use forward slashes for consistency across platforms
             key = str(relative_path).replace("\\", "/")
-            result[key] = fast_hash_file(file_path, algorithm)
-        except (PermissionError, OSError):
-            # Skip files we can't read
-            pass
+            result[key] = file_hash
+        results.append(result)
 
-    return result
+    return results
 
 
 def compare_hashes(
@@ -142,26 +484,313 @@ def compare_hashes(
             - "removed": Files in target but not source
             - "modified": Files in both but with different hashes
             - "unchanged": Files identical in both
+
+        Lists are in no particular order; sort them if presenting to users.
     """
-    source_keys = set(source_hashes.keys())
-    target_keys = set(target_hashes.keys())
+    source_keys = source_hashes.keys()
+    target_keys = target_hashes.keys()
+    source_items = source_hashes.items()
+    target_items = target_hashes.items()
 
     added = list(source_keys - target_keys)
     removed = list(target_keys - source_keys)
 
-    common = source_keys & target_keys
-    modified = []
-    unchanged = []
+    # Item views support set algebra in C: pairs present on both sides are
+    # unchanged, source pairs without a twin are either added or modified.
+    unchanged = [key for key, _ in source_items & target_items]
+    modified = [
+        key for key, _ in source_items - target_items
+        if key in target_hashes
+    ]
+
+    return {
+        "added": added,
+        "removed": removed,
+        "modified": modified,
+        "unchanged": unchanged,
+    }
+
+
+def _check_directory(directory: Path) -> None:
+    """Raise if directory is missing or not a directory."""
+    if not directory.exists():
+        raise FileNotFoundError(f"Directory not found: {directory}")
+
+    if not directory.is_dir():
+        raise ValueError(f"Not a directory: {directory}")
+
+
+def stat_files(
+    directory: Path,
+    patterns: Optional[list] = None,
+    pattern_re: Optional[Pattern[str]] = None
+) -> Dict[str, FileStat]:
+    """Stat every matching file under a directory.
+
+    Walks with os.scandir and takes each file's stat from its DirEntry
+    (free on Windows, one cached call elsewhere). Relative keys are cut
+    from the entry's path string rather than built with relative_to(),
+    and paths are returned as plain strings so no Path is built per file.
+
+    Args:
+        directory: Directory to scan
+        patterns: Glob patterns to filter files (default: ["*"] for all)
+        pattern_re: Precompiled regex from compile_patterns(patterns)
+
+    Returns:
+        Dict mapping relative file paths (forward slashes) to (path, stat).
+        Files that vanish, can't be stat'ed, or aren't regular files are
+        left out.
+
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+    """
+    directory = Path(directory)
+    _check_directory(directory)
+
+    patterns = patterns or ["*"]
+    if pattern_re is None:
+        pattern_re = compile_patterns(patterns)
+
+    root = os.fspath(directory)
+    prefix_len = len(os.path.join(root, ""))
+    result: Dict[str, FileStat] = {}
+
+    if pattern_re is not None:
+        match = pattern_re.match
+        for entry in _scan_files(root):
+            if not match(entry.name):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            key = entry.path[prefix_len:].replace("\\", "/")
+            result[key] = (entry.path, st)
+
+    # Path patterns are relative to the directory, so glob them as-is
+    for pattern in patterns:
+        if not _is_path_pattern(pattern):
+            continue
+        for path in _glob_path_pattern(directory, pattern):
+            key = str(path.relative_to(directory)).replace("\\", "/")
+            if key in result:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                result[key] = (str(path), st)
+
+    return result
+
+
+def _sorted_entries(path: Optional[str]) -> List[os.DirEntry]:
+    """List a directory's entries sorted by name ([] if missing/unreadable)."""
+    if path is None:
+        return []
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def _walk_pair_entries(
+    source: str,
+    target: str,
+    match: Callable[[str], object]
+) -> Iterator[Tuple[str, Optional[FileStat], Optional[FileStat]]]:
+    """Merge-walk two trees, one directory level at a time."""
+    stack: List[Tuple[str, Optional[str], Optional[str]]] = [
+        ("", source, target)
+    ]
+    while stack:
+        prefix, source_dir, target_dir = stack.pop()
+        left = _sorted_entries(source_dir)
+        right = _sorted_entries(target_dir)
+        i = j = 0
+        while i < len(left) or j < len(right):
+            # Sort-merge join on entry name
+            pair: Tuple[Optional[os.DirEntry], Optional[os.DirEntry]]
+            if j == len(right) or (
+                i < len(left) and left[i].name < right[j].name
+            ):
+                name = left[i].name
+                pair = (left[i], None)
+                i += 1
+            elif i == len(left) or right[j].name < left[i].name:
+                name = right[j].name
+                pair = (None, right[j])
+                j += 1
+            else:
+                name = left[i].name
+                pair = (left[i], right[j])
+                i += 1
+                j += 1
+
+            rel = prefix + name
+            sides: List[Optional[FileStat]] = [None, None]
+            subdirs: List[Optional[str]] = [None, None]
+            for side, entry in enumerate(pair):
+                if entry is None:
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Like _scan_files, symlinked directories are skipped
+                    if not entry.is_symlink():
+                        subdirs[side] = entry.path
+                    continue
+                if not match(entry.name):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    sides[side] = (entry.path, st)
+
+            if subdirs[0] is not None or subdirs[1] is not None:
+                stack.append((rel + "/", subdirs[0], subdirs[1]))
+            if sides[0] is not None or sides[1] is not None:
+                yield rel, sides[0], sides[1]
+
+
+def walk_pair(
+    source: Path,
+    target: Path,
+    patterns: Optional[list] = None,
+    pattern_re: Optional[Pattern[str]] = None
+) -> Iterator[Tuple[str, Optional[FileStat], Optional[FileStat]]]:
+    """Walk two directory trees in lockstep, pairing files by relative path.
+
+    Each directory level is scanned on both sides, sorted by name and
+    merged, so files are classified as they are found instead of first
+    collecting a dict per tree and diffing their key sets.
+
+    Args:
+        source: First directory
+        target: Second directory
+        patterns: Glob patterns to filter files (default: ["*"] for all)
+        pattern_re: Precompiled regex from compile_patterns(patterns)
+
+    Returns:
+        Iterator of (relative path, source file, target file), where each
+        file is a (path, stat) tuple as in stat_files(), or None if the
+        file is absent on that side. Order is unspecified.
+
+    Raises:
+        FileNotFoundError: If either directory doesn't exist
+    """
+    source = Path(source)
+    target = Path(target)
+    _check_directory(source)
+    _check_directory(target)
+
+    patterns = patterns or ["*"]
+    if any(_is_path_pattern(pattern) for pattern in patterns):
+        # Path globs don't map onto a per-level name walk; merge the
+        # materialized listings instead
+        source_files = stat_files(source, patterns, pattern_re)
+        target_files = stat_files(target, patterns, pattern_re)
+        return (
+            (key, source_files.get(key), target_files.get(key))
+            for key in source_files.keys() | target_files.keys()
+        )
+
+    if pattern_re is None:
+        pattern_re = compile_patterns(patterns)
+        if pattern_re is None:
+            # Unreachable: compile_patterns() returns None only when every
+            # pattern is a path pattern, which is handled above
+            return iter(())
+    return _walk_pair_entries(
+        os.fspath(source), os.fspath(target), pattern_re.match
+    )
+
+
+def diff_directories(
+    source: Path,
+    target: Path,
+    patterns: Optional[list] = None,
+    algorithm: str = "auto",
+    pattern_re: Optional[Pattern[str]] = None,
+    executor: Optional[Executor] = None,
+    trust_mtime: bool = False
+) -> Dict[str, list]:
+    """Compare two directories, hashing only files whose sizes match.
+
+    Files present on one side only need no hash, and files whose sizes
+    differ are definitely modified, so only same-size pairs are hashed.
+    With trust_mtime, same-size pairs whose mtimes also match are taken
+    as unchanged without hashing either.
+
+    Args:
+        source: Source directory
+        target: Target directory
+        patterns: Glob patterns to filter files (default: ["*"] for all)
+        algorithm: Hash algorithm to use
+        pattern_re: Precompiled regex from compile_patterns(patterns)
+        executor: Executor to hash files concurrently (default: a shared
+                  thread pool; batches of two or fewer are hashed inline)
+        trust_mtime: Treat equal size and mtime_ns as equal content
+
+    Returns:
+        Dict with the same keys as compare_hashes(). Files that can't be
+        read on either side are reported as modified.
 
-    for key in common:
-        if source_hashes[key] != target_hashes[key]:
+    Raises:
+        FileNotFoundError: If either directory doesn't exist
+    """
+    added: List[str] = []
+    removed: List[str] = []
+    modified: List[str] = []
+    unchanged: List[str] = []
+    candidates: List[str] = []
+    source_paths: List[str] = []
+    target_paths: List[str] = []
+
+    for key, source_file, target_file in walk_pair(
+        source, target, patterns, pattern_re
+    ):
+        if target_file is None:
+            added.append(key)
+            continue
+        if source_file is None:
+            removed.append(key)
+            continue
+        source_st = source_file[1]
+        target_st = target_file[1]
+        if target_st.st_size != source_st.st_size:
             modified.append(key)
+        elif trust_mtime and target_st.st_mtime_ns == source_st.st_mtime_ns:
+            unchanged.append(key)
         else:
+            candidates.append(key)
+            source_paths.append(source_file[0])
+            target_paths.append(target_file[0])
+
+    # Hash source and target copies of each same-size file in one batch
+    hashes = hash_files(source_paths + target_paths, algorithm, executor)
+
+    count = len(candidates)
+    for key, source_hash, target_hash in zip(
+        candidates, hashes[:count], hashes[count:]
+    ):
+        if source_hash is not None and source_hash == target_hash:
             unchanged.append(key)
+        else:
+            modified.append(key)
 
     return {
-        "added": sorted(added),
-        "removed": sorted(removed),
-        "modified": sorted(modified),
-        "unchanged": sorted(unchanged),
+        "added": added,
+        "removed": removed,
+        "modified": modified,
+        "unchanged": unchanged,
     }
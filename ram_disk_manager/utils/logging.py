@@ -10,19 +10,57 @@ Provides consistent logging across all modules with:
 import json
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # Default format for text output
 TEXT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Standard LogRecord attributes excluded from JSON "extra" fields
+_RECORD_STD_ATTRS = frozenset({
+    "name", "msg", "args", "created", "filename", "funcName",
+    "levelname", "levelno", "lineno", "module", "msecs",
+    "pathname", "process", "processName", "relativeCreated",
+    "stack_info", "exc_info", "exc_text", "thread", "threadName",
+    "message", "taskName",
+})
 
 
 class JsonFormatter(logging.Formatter):
     """Format log records as JSON lines for structured logging."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Records arrive in bursts within the same second; reuse the
+        # formatted date/time prefix instead of calling strftime each time.
+        self._cached_second = -1
+        self._cached_prefix = ""
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record creation time as ISO 8601 UTC.
+
+        Args:
+            created: Record creation time (seconds since the epoch)
+
+        Returns:
+            Timestamp string like "2025-01-01T12:00:00.123456Z"
+        """
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime(ISO_FORMAT, time.gmtime(second))
+            self._cached_second = second
+        return "%s.%06dZ" % (self._cached_prefix, (created - second) * 1e6)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as JSON.
 
@@ -33,7 +71,7 @@ class JsonFormatter(logging.Formatter):
             JSON string representation of the log record
         """
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -43,23 +81,34 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Include any extra fields
+        # Include any extra fields (non-serializable values fall back to str)
         for key, value in record.__dict__.items():
-            if key not in (
-                "name", "msg", "args", "created", "filename", "funcName",
-                "levelname", "levelno", "lineno", "module", "msecs",
-                "pathname", "process", "processName", "relativeCreated",
-                "stack_info", "exc_info", "exc_text", "thread", "threadName",
-                "message", "taskName"
-            ):
-                try:
-                    # Ensure value is JSON serializable
-                    json.dumps(value)
-                    log_data[key] = value
-                except (TypeError, ValueError):
-                    log_data[key] = str(value)
-
-        return json.dumps(log_data)
+            if key not in _RECORD_STD_ATTRS:
+                log_data[key] = value
+
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(log_data, default=str).decode()
+            except TypeError:
+                # e.g. integers wider than 64 bits; let stdlib json handle it
+                pass
+
+        try:
+            return json.dumps(log_data, default=str)
+        except (TypeError, ValueError):
+            # e.g. a circular reference; stringify the offending fields
+            return json.dumps({
+                key: _json_safe(value) for key, value in log_data.items()
+            })
+
+
+def _json_safe(value: Any) -> Any:
+    """Return value if JSON can serialize it, else its str()."""
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return str(value)
 
 
 def get_logger(
@@ -7,6 +7,7 @@ Handles Windows/Linux differences for:
 """
 
 import ctypes
+import functools
 import os
 import sys
 from pathlib import Path
@@ -14,10 +15,27 @@ from pathlib import Path
 # Import Platform enum from config to maintain single source of truth
 from ram_disk_manager.config import Platform
 
+# Default RAM disk mount points, built once at import
+_DEFAULT_RAM_PATHS = {
+    Platform.WINDOWS: Path("R:\\"),  # common RAM disk drive letter
+    Platform.MACOS: Path("/Volumes"),  # hdiutil mount location
+    Platform.LINUX: Path("/mnt/ramdisk"),  # tmpfs mount point
+}
 
+# System temp directories (Linux and macOS both use /tmp)
+_TEMP_PATHS = {
+    Platform.WINDOWS: Path(os.environ.get("TEMP", "C:\\Temp")),
+    Platform.MACOS: Path("/tmp"),
+    Platform.LINUX: Path("/tmp"),
+}
+
+
+@functools.lru_cache(maxsize=1)
 def detect_platform() -> Platform:
     """Detect the current operating system platform.
 
+    The result is cached, since the OS can't change while the process runs.
+
     Returns:
         Platform.WINDOWS, Platform.LINUX, or Platform.MACOS based on sys.platform
 
@@ -37,12 +55,79 @@ def detect_platform() -> Platform:
         return Platform.LINUX
 
 
+# Windows token access right and TOKEN_INFORMATION_CLASS value
+_TOKEN_QUERY = 0x0008
+_TOKEN_ELEVATION = 20
+
+
+def _is_token_elevated() -> bool:
+    """Check the TokenElevation flag of the current process token (Windows).
+
+    Returns:
+        True if the process token is elevated
+
+    Raises:
+        OSError: If the token can't be opened or queried
+        AttributeError: If not running on Windows
+    """
+    if sys.platform != "win32":
+        raise AttributeError("Process tokens are only available on Windows")
+
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+
+    # Declare every signature, so 64-bit handles aren't squeezed through
+    # the default C int conversion
+    kernel32.GetCurrentProcess.argtypes = []
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    advapi32.OpenProcessToken.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE)
+    ]
+    advapi32.OpenProcessToken.restype = wintypes.BOOL
+    advapi32.GetTokenInformation.argtypes = [
+        wintypes.HANDLE,
+        ctypes.c_int,
+        wintypes.LPVOID,
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    advapi32.GetTokenInformation.restype = wintypes.BOOL
+
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(
+        kernel32.GetCurrentProcess(), _TOKEN_QUERY, ctypes.byref(token)
+    ):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        elevation = wintypes.DWORD()
+        returned = wintypes.DWORD()
+        if not advapi32.GetTokenInformation(
+            token,
+            _TOKEN_ELEVATION,
+            ctypes.byref(elevation),
+            ctypes.sizeof(elevation),
+            ctypes.byref(returned),
+        ):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return elevation.value != 0
+    finally:
+        kernel32.CloseHandle(token)
+
+
+@functools.lru_cache(maxsize=1)
 def is_admin() -> bool:
     """Check if the current process has elevated privileges.
 
     On Windows: Checks for Administrator rights
     On Linux/macOS: Checks for root (UID 0)
 
+    The result is cached, since privileges don't change during the process.
+
     Returns:
         True if running with elevated privileges, False otherwise
 
@@ -50,22 +135,18 @@ def is_admin() -> bool:
         >>> if not is_admin():
         ...     print("Warning: Some operations may require admin privileges")
     """
-    platform = detect_platform()
-
-    if platform == Platform.WINDOWS:
+    if sys.platform == "win32":
         try:
             # Windows-specific admin check
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except (AttributeError, OSError):
-            # Fallback: try to access a protected location
-            try:
-                # Try to write to a Windows-protected location
-                test_path = Path(os.environ.get("SYSTEMROOT", "C:\\Windows")) / "temp_admin_test"
-                test_path.touch()
-                test_path.unlink()
-                return True
-            except (PermissionError, OSError):
-                return False
+        except (AttributeError, OSError, ctypes.ArgumentError):
+            pass
+
+        try:
+            # Ask the process token directly, without touching the filesystem
+            return _is_token_elevated()
+        except (AttributeError, OSError, ctypes.ArgumentError):
+            return False
     else:
         # Linux/Unix: check for root
         return os.geteuid() == 0
@@ -93,12 +174,7 @@ def get_default_ram_path(platform: Platform) -> Path:
     if platform == Platform.AUTO:
         platform = detect_platform()
 
-    if platform == Platform.WINDOWS:
-        return Path("R:\\")
-    elif platform == Platform.MACOS:
-        return Path("/Volumes")
-    else:
-        return Path("/mnt/ramdisk")
+    return _DEFAULT_RAM_PATHS[platform]
 
 
 def get_temp_path(platform: Platform) -> Path:
@@ -113,11 +189,7 @@ def get_temp_path(platform: Platform) -> Path:
     if platform == Platform.AUTO:
         platform = detect_platform()
 
-    if platform == Platform.WINDOWS:
-        return Path(os.environ.get("TEMP", "C:\\Temp"))
-    else:
-        # Linux and macOS both use /tmp
-        return Path("/tmp")
+    return _TEMP_PATHS[platform]
 
 
 def ensure_path_exists(path: Path, is_dir: bool = True) -> bool:
@@ -130,11 +202,15 @@ def ensure_path_exists(path: Path, is_dir: bool = True) -> bool:
     Returns:
         True if path exists or was created, False on failure
     """
+    target = path if is_dir else path.parent
+
+    # Steady state: the directory is already there, so a single stat
+    # avoids the mkdir syscall and its per-component permission checks
+    if os.path.isdir(os.fspath(target)):
+        return True
+
     try:
-        if is_dir:
-            path.mkdir(parents=True, exist_ok=True)
-        else:
-            path.parent.mkdir(parents=True, exist_ok=True)
+        target.mkdir(parents=True, exist_ok=True)
         return True
     except (PermissionError, OSError):
         return False
@@ -149,14 +225,13 @@ def check_ram_disk_available(ram_path: Path) -> bool:
     Returns:
         True if the path exists and is writable
     """
-    if not ram_path.exists():
-        return False
-
-    # Try to write a test file
-    test_file = ram_path / ".ram_disk_test"
+    # Create and remove a test file with raw os calls; a missing mount
+    # point simply fails the open, so no separate exists() check is needed
+    test_file = os.path.join(os.fspath(ram_path), ".ram_disk_test")
     try:
-        test_file.write_text("test")
-        test_file.unlink()
+        fd = os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.close(fd)
+        os.unlink(test_file)
         return True
     except (PermissionError, OSError):
         return False
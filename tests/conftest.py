@@ -6,11 +6,19 @@ testing RAM disk manager components without touching real filesystems.
 
 import json
 import shutil
+import tempfile
 from pathlib import Path
 
 import pytest
 
+try:
+    import pyfakefs  # noqa: F401
+    PYFAKEFS_AVAILABLE = True
+except ImportError:
+    PYFAKEFS_AVAILABLE = False
+
 from ram_disk_manager.config import RamDiskConfig, ManagerConfig, SyncStrategy, Platform
+from ram_disk_manager.sync.dual_write import DualWriteController
 
 
 @pytest.fixture
@@ -48,28 +56,94 @@ def sample_manager_config():
     )
 
 
-@pytest.fixture
-def populated_dirs(tmp_dirs):
-    """Create temp directories with sample files for sync tests."""
-    disk = tmp_dirs["disk"]
-
-    # Create sample files on disk (truth)
+def _populate_disk(disk: Path) -> None:
+    """Create sample files on disk (truth)."""
     (disk / "file1.txt").write_text("hello world")
     (disk / "file2.json").write_text(json.dumps({"key": "value"}))
     (disk / "subdir").mkdir()
     (disk / "subdir" / "nested.txt").write_text("nested content")
     (disk / "data.bin").write_bytes(b"\x00\x01\x02\x03" * 100)
 
+
+@pytest.fixture
+def populated_dirs(tmp_dirs):
+    """Create temp directories with sample files for sync tests."""
+    _populate_disk(tmp_dirs["disk"])
     return tmp_dirs
 
 
+@pytest.fixture(scope="session")
+def populated_dirs_ro(tmp_path_factory):
+    """Session-wide populated_dirs layout for tests that only read it.
+
+    Built once per run. Tests must not modify these files; use
+    populated_dirs for anything that writes.
+    """
+    root = tmp_path_factory.mktemp("populated_ro")
+    disk_path = root / "disk"
+    ram_path = root / "ram"
+    disk_path.mkdir()
+    ram_path.mkdir()
+    _populate_disk(disk_path)
+    return {"disk": disk_path, "ram": ram_path, "root": root}
+
+
 @pytest.fixture
-def dual_write_config(tmp_dirs):
-    """Config specifically for DualWriteController tests."""
+def mem_dirs(request):
+    """Like tmp_dirs, but on pyfakefs's in-memory filesystem.
+
+    Falls back to real temp directories when pyfakefs isn't installed.
+    """
+    if PYFAKEFS_AVAILABLE:
+        request.getfixturevalue("fs")
+        root = Path(tempfile.gettempdir()) / "mem_dirs"
+    else:
+        root = request.getfixturevalue("tmp_path")
+
+    disk_path = root / "disk"
+    ram_path = root / "ram"
+    disk_path.mkdir(parents=True)
+    ram_path.mkdir(parents=True)
+    return {"disk": disk_path, "ram": ram_path, "root": root}
+
+
+@pytest.fixture
+def dual_write_config(mem_dirs):
+    """Config specifically for DualWriteController tests (in-memory FS)."""
     return RamDiskConfig(
         name="dual_write_test",
-        disk_path=tmp_dirs["disk"],
-        ram_path=tmp_dirs["ram"],
+        disk_path=mem_dirs["disk"],
+        ram_path=mem_dirs["ram"],
         size_mb=32,
         sync_strategy=SyncStrategy.FULL,
     )
+
+
+@pytest.fixture
+def dual_write_ctrl(dual_write_config):
+    """DualWriteController over dual_write_config."""
+    return DualWriteController(dual_write_config)
+
+
+@pytest.fixture
+def fail_ram_writes(monkeypatch):
+    """Make write_bytes fail for files under a controller's RAM path.
+
+    Call with the controller once its Path class is known; the patch is
+    undone automatically at teardown. Patches the controller's own Path
+    class, which is pyfakefs's fake Path when the in-memory filesystem
+    is active.
+    """
+    def install(ctrl):
+        path_cls = type(ctrl.ram_path)
+        ram_path = ctrl.ram_path
+        original_write_bytes = path_cls.write_bytes
+
+        def patched_write_bytes(self, data):
+            if self.is_relative_to(ram_path):
+                raise OSError("Simulated RAM failure")
+            return original_write_bytes(self, data)
+
+        monkeypatch.setattr(path_cls, "write_bytes", patched_write_bytes)
+
+    return install
@@ -18,14 +18,16 @@ from ram_disk_manager.config import (
 class TestSyncStrategy:
     """Verify SyncStrategy enum values."""
 
-    def test_full_value(self):
-        assert SyncStrategy.FULL.value == "full"
-
-    def test_incremental_value(self):
-        assert SyncStrategy.INCREMENTAL.value == "incremental"
-
-    def test_pattern_value(self):
-        assert SyncStrategy.PATTERN.value == "pattern"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (SyncStrategy.FULL, "full"),
+            (SyncStrategy.INCREMENTAL, "incremental"),
+            (SyncStrategy.PATTERN, "pattern"),
+        ],
+    )
+    def test_value(self, member, value):
+        assert member.value == value
 
     def test_from_string(self):
         assert SyncStrategy("full") == SyncStrategy.FULL
@@ -39,11 +41,17 @@ class TestSyncStrategy:
 class TestPlatform:
     """Verify Platform enum values."""
 
-    def test_values(self):
-        assert Platform.WINDOWS.value == "windows"
-        assert Platform.LINUX.value == "linux"
-        assert Platform.MACOS.value == "darwin"
-        assert Platform.AUTO.value == "auto"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (Platform.WINDOWS, "windows"),
+            (Platform.LINUX, "linux"),
+            (Platform.MACOS, "darwin"),
+            (Platform.AUTO, "auto"),
+        ],
+    )
+    def test_value(self, member, value):
+        assert member.value == value
 
 
 class TestRamDiskConfig:
@@ -4,17 +4,27 @@ Validates file hashing, directory hashing, and hash comparison logic.
 These are the foundation of sync integrity -- if hashing breaks, everything breaks.
 """
 
+import hashlib
 import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from ram_disk_manager.utils import hashing
 from ram_disk_manager.utils.hashing import (
     fast_hash_file,
     hash_directory,
     compare_hashes,
+    diff_directories,
+    walk_pair,
 )
 
+_TEXT = "hello world"
+_BIN_BLOB = b"\x00\x01\x02\x03" * 1000
+
 
 class TestFastHashFile:
     """Test file hashing with different algorithms."""
@@ -22,7 +32,7 @@ class TestFastHashFile:
     def test_hash_text_file(self, tmp_path):
         """Basic text file should produce consistent hash."""
         f = tmp_path / "test.txt"
-        f.write_text("hello world")
+        f.write_text(_TEXT)
         h1 = fast_hash_file(f)
         h2 = fast_hash_file(f)
         assert h1 == h2
@@ -32,7 +42,7 @@ class TestFastHashFile:
     def test_hash_binary_file(self, tmp_path):
         """Binary file should hash correctly."""
         f = tmp_path / "test.bin"
-        f.write_bytes(b"\x00\x01\x02\x03" * 1000)
+        f.write_bytes(_BIN_BLOB)
         h = fast_hash_file(f)
         assert isinstance(h, str)
         assert len(h) > 0
@@ -49,8 +59,8 @@ class TestFastHashFile:
         """Same content in different files must produce same hash."""
         f1 = tmp_path / "a.txt"
         f2 = tmp_path / "b.txt"
-        f1.write_text("identical")
-        f2.write_text("identical")
+        f1.write_bytes(_BIN_BLOB)
+        shutil.copyfile(f1, f2)
         assert fast_hash_file(f1) == fast_hash_file(f2)
 
     def test_nonexistent_file_raises(self, tmp_path):
@@ -61,6 +71,13 @@ class TestFastHashFile:
         with pytest.raises(ValueError, match="Not a file"):
             fast_hash_file(tmp_path)
 
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs mkfifo")
+    def test_fifo_raises_without_blocking(self, tmp_path):
+        fifo = tmp_path / "pipe"
+        os.mkfifo(fifo)
+        with pytest.raises(ValueError, match="Not a file"):
+            fast_hash_file(fifo)
+
     def test_md5_algorithm(self, tmp_path):
         f = tmp_path / "test.txt"
         f.write_text("md5 test")
@@ -75,12 +92,54 @@ class TestFastHashFile:
         assert isinstance(h, str)
         assert len(h) == 64  # SHA256 produces 64 hex chars
 
+    @pytest.mark.skipif(
+        not hashing.BLAKE3_AVAILABLE, reason="blake3 not installed"
+    )
+    def test_blake3_algorithm(self, tmp_path):
+        import blake3
+
+        small = tmp_path / "small.txt"
+        small.write_text("blake3 test")
+        assert fast_hash_file(small, algorithm="blake3") == (
+            blake3.blake3(b"blake3 test").hexdigest()
+        )
+        # Large files go through update_mmap when mapping is allowed
+        large = tmp_path / "large.bin"
+        large.write_bytes(_BIN_BLOB * (hashing.MMAP_THRESHOLD // len(_BIN_BLOB) + 1))
+        expected = blake3.blake3(large.read_bytes()).hexdigest()
+        assert fast_hash_file(large, algorithm="blake3", use_mmap=True) == expected
+        assert fast_hash_file(large, algorithm="blake3") == expected
+
     def test_unknown_algorithm_raises(self, tmp_path):
         f = tmp_path / "test.txt"
         f.write_text("test")
         with pytest.raises(ValueError, match="Unknown algorithm"):
             fast_hash_file(f, algorithm="bogus")
 
+    def test_algorithm_dispatch_map(self, tmp_path):
+        """Named algorithms dispatch through prebuilt hashlib constructors."""
+        assert hashing._ALGO_MAP["md5"] is hashlib.md5
+        assert hashing._ALGO_MAP["sha256"] is hashlib.sha256
+        f = tmp_path / "test.txt"
+        f.write_text("blake2b test")
+        expected = hashlib.blake2b(b"blake2b test").hexdigest()
+        assert fast_hash_file(f, algorithm="blake2b") == expected
+
+    def test_read_buffer_reused(self, tmp_path):
+        """Files are read through one buffer per thread, not fresh chunks."""
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_text(_TEXT * 1000)
+        b.write_bytes(_BIN_BLOB)
+        assert fast_hash_file(a, algorithm="sha256") == (
+            hashlib.sha256(a.read_bytes()).hexdigest()
+        )
+        buf = hashing._read_buffer()
+        assert fast_hash_file(b, algorithm="sha256") == (
+            hashlib.sha256(_BIN_BLOB).hexdigest()
+        )
+        assert hashing._read_buffer() is buf
+
     def test_empty_file(self, tmp_path):
         """Empty file should still produce a valid hash."""
         f = tmp_path / "empty.txt"
@@ -89,6 +148,44 @@ class TestFastHashFile:
         assert isinstance(h, str)
         assert len(h) > 0
 
+    def test_large_file_matches_hashlib(self, tmp_path):
+        """Files above the mmap threshold must hash the same as a plain read."""
+        data = b"\x00\x01\x02\x03" * (1 << 19)  # 2 MiB
+        f = tmp_path / "large.bin"
+        f.write_bytes(data)
+        assert fast_hash_file(f, algorithm="md5", use_mmap=True) == (
+            hashlib.md5(data).hexdigest()
+        )
+
+    def test_large_file_not_mapped_by_default(self, tmp_path, monkeypatch):
+        """Live files may shrink mid-hash, so mapping is opt-in."""
+        data = b"\x00\x01\x02\x03" * (1 << 19)  # 2 MiB
+        f = tmp_path / "large.bin"
+        f.write_bytes(data)
+
+        def no_mmap(*args, **kwargs):
+            raise AssertionError("file mapped without use_mmap")
+
+        monkeypatch.setattr(hashing.mmap, "mmap", no_mmap)
+        assert fast_hash_file(f, algorithm="md5") == hashlib.md5(data).hexdigest()
+        assert hash_directory(tmp_path, algorithm="md5") == {
+            "large.bin": hashlib.md5(data).hexdigest()
+        }
+
+    def test_large_file_mmap_failure_falls_back(self, tmp_path, monkeypatch):
+        """If mapping fails, large files are hashed with a plain read."""
+        data = b"\x00\x01\x02\x03" * (1 << 19)  # 2 MiB
+        f = tmp_path / "large.bin"
+        f.write_bytes(data)
+
+        def no_mmap(*args, **kwargs):
+            raise OSError("mmap not supported")
+
+        monkeypatch.setattr(hashing.mmap, "mmap", no_mmap)
+        assert fast_hash_file(f, algorithm="md5", use_mmap=True) == (
+            hashlib.md5(data).hexdigest()
+        )
+
 
 class TestHashDirectory:
     """Test directory hashing and file collection."""
@@ -103,20 +200,16 @@ class TestHashDirectory:
         assert "test.txt" in result
         assert len(result) == 1
 
-    def test_nested_directory(self, tmp_path):
-        (tmp_path / "sub").mkdir()
-        (tmp_path / "sub" / "nested.txt").write_text("nested")
-        (tmp_path / "root.txt").write_text("root")
-        result = hash_directory(tmp_path)
-        assert "root.txt" in result
-        assert "sub/nested.txt" in result
-        assert len(result) == 2
+    def test_nested_directory(self, populated_dirs_ro):
+        result = hash_directory(populated_dirs_ro["disk"])
+        assert "file1.txt" in result
+        assert "subdir/nested.txt" in result
+        assert len(result) == 4
 
-    def test_forward_slash_keys(self, tmp_path):
+    def test_forward_slash_keys(self, populated_dirs_ro):
         """Keys should use forward slashes regardless of platform."""
-        (tmp_path / "sub").mkdir()
-        (tmp_path / "sub" / "file.txt").write_text("test")
-        result = hash_directory(tmp_path)
+        result = hash_directory(populated_dirs_ro["disk"])
+        assert "subdir/nested.txt" in result
         for key in result:
             assert "\\" not in key
 
@@ -140,6 +233,84 @@ class TestHashDirectory:
         for key in result:
             assert key.endswith(".txt")
 
+    def test_symlinked_directory_not_followed(self, tmp_path):
+        """The tree walk must not descend into symlinked directories."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "external.txt").write_text("external")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "inside.txt").write_text("inside")
+        try:
+            (root / "link").symlink_to(outside, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+        assert set(hash_directory(root)) == {"inside.txt"}
+
+    def test_directory_pattern_matches_at_any_depth(self, tmp_path):
+        """A "dir/*.ext" pattern matches like rglob, not against names."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.txt").write_text("a")
+        (tmp_path / "x" / "sub").mkdir(parents=True)
+        (tmp_path / "x" / "sub" / "b.txt").write_text("b")
+        (tmp_path / "c.txt").write_text("c")
+        result = hash_directory(tmp_path, patterns=["sub/*.txt"])
+        assert sorted(result) == ["sub/a.txt", "x/sub/b.txt"]
+        stats = hashing.stat_files(tmp_path, patterns=["sub/*.txt"])
+        assert sorted(stats) == ["sub/a.txt", "x/sub/b.txt"]
+
+    def test_collect_files_skips_dangling_symlinks_and_fifos(self, tmp_path):
+        """Only regular files (or links to them) are collected."""
+        (tmp_path / "real.txt").write_text("real")
+        try:
+            (tmp_path / "broken").symlink_to(tmp_path / "missing")
+            (tmp_path / "alias.txt").symlink_to(tmp_path / "real.txt")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+        if hasattr(os, "mkfifo"):
+            os.mkfifo(tmp_path / "pipe")
+        assert hashing.collect_files(tmp_path) == {
+            tmp_path / "real.txt",
+            tmp_path / "alias.txt",
+        }
+
+    def test_multiple_patterns(self, tmp_path):
+        """Files matching any of several patterns are hashed, at any depth."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub" / "b.json").write_text("{}")
+        (tmp_path / "sub" / "c.bin").write_bytes(b"c")
+        result = hash_directory(tmp_path, patterns=["*.txt", "*.json"])
+        assert sorted(result) == ["a.txt", "sub/b.json"]
+
+    def test_executor_matches_serial(self, tmp_path):
+        """Hashing through an executor must give the same mapping."""
+        (tmp_path / "sub").mkdir()
+        for i in range(8):
+            (tmp_path / "sub" / f"f{i}.txt").write_text(f"content {i}")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = hash_directory(tmp_path, executor=pool)
+        assert parallel == hash_directory(tmp_path)
+
+    def test_hash_directories_matches_individual(self, populated_dirs_ro, tmp_path):
+        """Batched hashing splits results back out per directory."""
+        disk = populated_dirs_ro["disk"]
+        (tmp_path / "other.txt").write_text("other")
+        disk_hashes, other_hashes = hashing.hash_directories([disk, tmp_path])
+        assert disk_hashes == hash_directory(disk)
+        assert other_hashes == hash_directory(tmp_path)
+
+    def test_small_directory_skips_pool(self, tmp_path, monkeypatch):
+        """One or two files are hashed inline without the shared pool."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+
+        def no_pool():
+            raise AssertionError("default pool used for a small batch")
+
+        monkeypatch.setattr(hashing, "_default_executor", no_pool)
+        assert set(hash_directory(tmp_path)) == {"a.txt", "b.txt"}
+
 
 class TestCompareHashes:
     """Test hash comparison logic."""
@@ -205,8 +376,143 @@ class TestCompareHashes:
         assert diff["modified"] == ["changed.txt"]
         assert diff["unchanged"] == ["same.txt"]
 
-    def test_results_are_sorted(self):
+    def test_results_are_lists(self):
+        """Results are plain lists; ordering is left to the caller."""
         source = {"c.txt": "1", "a.txt": "2", "b.txt": "3"}
         target = {}
         diff = compare_hashes(source, target)
-        assert diff["added"] == ["a.txt", "b.txt", "c.txt"]
+        assert isinstance(diff["added"], list)
+        assert sorted(diff["added"]) == ["a.txt", "b.txt", "c.txt"]
+
+    def test_partition_covers_every_key(self):
+        """Each key lands in exactly one bucket."""
+        source = {f"f{i}": str(i % 3) for i in range(0, 100)}
+        target = {f"f{i}": str(i % 5) for i in range(50, 150)}
+        diff = compare_hashes(source, target)
+        buckets = [set(diff[name]) for name in diff]
+        assert sum(len(b) for b in buckets) == len(source.keys() | target.keys())
+        assert set().union(*buckets) == source.keys() | target.keys()
+        assert set(diff["unchanged"]) == {
+            k for k in source.keys() & target.keys() if source[k] == target[k]
+        }
+
+
+class TestDiffDirectories:
+    """Test size-first directory comparison."""
+
+    def test_complex_diff(self, tmp_dirs):
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        (disk / "same.txt").write_text("aaa")
+        (ram / "same.txt").write_text("aaa")
+        (disk / "resized.txt").write_text("bbb")
+        (ram / "resized.txt").write_text("bbbb")
+        (disk / "changed.txt").write_text("ccc")
+        (ram / "changed.txt").write_text("xxx")
+        (disk / "new.txt").write_text("new")
+        (ram / "deleted.txt").write_text("old")
+
+        diff = diff_directories(disk, ram)
+        assert diff["added"] == ["new.txt"]
+        assert diff["removed"] == ["deleted.txt"]
+        assert sorted(diff["modified"]) == ["changed.txt", "resized.txt"]
+        assert diff["unchanged"] == ["same.txt"]
+
+    def test_size_mismatch_skips_hashing(self, tmp_dirs, monkeypatch):
+        """Files whose sizes differ, or that exist on one side only, aren't hashed."""
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        (disk / "resized.txt").write_text("short")
+        (ram / "resized.txt").write_text("much longer")
+        (disk / "new.txt").write_text("new")
+
+        hashed = []
+        original = hashing.fast_hash_file
+
+        def counting_hash(path, algorithm="auto"):
+            hashed.append(path)
+            return original(path, algorithm)
+
+        monkeypatch.setattr(hashing, "fast_hash_file", counting_hash)
+        diff = diff_directories(disk, ram)
+        assert diff["modified"] == ["resized.txt"]
+        assert hashed == []
+
+    def test_trust_mtime_skips_same_stat_pairs(self, tmp_dirs):
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        (disk / "f.txt").write_text("aaa")
+        (ram / "f.txt").write_text("bbb")
+        for path in (disk / "f.txt", ram / "f.txt"):
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        assert diff_directories(disk, ram)["modified"] == ["f.txt"]
+        trusted = diff_directories(disk, ram, trust_mtime=True)
+        assert trusted["unchanged"] == ["f.txt"]
+        assert trusted["modified"] == []
+
+    def test_nonexistent_directory_raises(self, tmp_dirs):
+        with pytest.raises(FileNotFoundError):
+            diff_directories(tmp_dirs["disk"], tmp_dirs["root"] / "nonexistent")
+
+
+class TestWalkPair:
+    """Test the lockstep walk over two directory trees."""
+
+    def _pairs(self, disk, ram, patterns=None):
+        return {
+            rel: (disk_file is not None, ram_file is not None)
+            for rel, disk_file, ram_file in walk_pair(disk, ram, patterns)
+        }
+
+    def test_pairs_by_relative_path(self, tmp_dirs):
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        (disk / "sub" / "deep").mkdir(parents=True)
+        (ram / "sub").mkdir()
+        (disk / "both.txt").write_text("a")
+        (ram / "both.txt").write_text("a")
+        (disk / "sub" / "deep" / "disk_only.txt").write_text("d")
+        (ram / "sub" / "ram_only.txt").write_text("r")
+
+        assert self._pairs(disk, ram) == {
+            "both.txt": (True, True),
+            "sub/deep/disk_only.txt": (True, False),
+            "sub/ram_only.txt": (False, True),
+        }
+
+    def test_file_against_directory(self, tmp_dirs):
+        """A file on one side and a directory of the same name on the other."""
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        (disk / "x").write_text("file")
+        (ram / "x").mkdir()
+        (ram / "x" / "inner.txt").write_text("inner")
+
+        assert self._pairs(disk, ram) == {
+            "x": (True, False),
+            "x/inner.txt": (False, True),
+        }
+
+    def test_recursive_pattern_matches_stat_files(self, tmp_dirs):
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        (disk / "a").mkdir()
+        (disk / "a" / "f.md").write_text("x")
+        (ram / "top.md").write_text("y")
+        (ram / "skip.txt").write_text("z")
+
+        assert self._pairs(disk, ram, ["**/*.md"]) == {
+            "a/f.md": (True, False),
+            "top.md": (False, True),
+        }
+
+    def test_directory_pattern(self, tmp_dirs):
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        (disk / "sub").mkdir()
+        (disk / "sub" / "a.txt").write_text("a")
+        (disk / "b.txt").write_text("b")
+        (ram / "sub").mkdir()
+        (ram / "sub" / "a.txt").write_text("a")
+
+        assert self._pairs(disk, ram, ["sub/*.txt"]) == {
+            "sub/a.txt": (True, True),
+        }
+
+    def test_nonexistent_directory_raises(self, tmp_dirs):
+        with pytest.raises(FileNotFoundError):
+            walk_pair(tmp_dirs["disk"], tmp_dirs["root"] / "nonexistent")
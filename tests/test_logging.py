@@ -0,0 +1,86 @@
+"""Tests for ram_disk_manager.utils.logging module.
+
+Validates JsonFormatter output: timestamps, extra fields, and
+serialization of values JSON can't represent directly.
+"""
+
+import json
+import logging
+
+import pytest
+
+from ram_disk_manager.utils import logging as log_module
+from ram_disk_manager.utils.logging import JsonFormatter
+
+
+def _record(msg="hello", created=None, **extra):
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, msg, None, None
+    )
+    if created is not None:
+        record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatterTimestamp:
+    """Test the cached per-second timestamp prefix."""
+
+    def test_timestamp_from_record_created(self):
+        out = json.loads(JsonFormatter().format(_record(created=1700000000.5)))
+        assert out["timestamp"] == "2023-11-14T22:13:20.500000Z"
+
+    def test_timestamp_across_second_boundary(self):
+        formatter = JsonFormatter()
+        stamps = [
+            json.loads(formatter.format(_record(created=created)))["timestamp"]
+            for created in (1700000000.25, 1700000000.75, 1700000001.0, 1700000059.5)
+        ]
+        assert stamps == [
+            "2023-11-14T22:13:20.250000Z",
+            "2023-11-14T22:13:20.750000Z",
+            "2023-11-14T22:13:21.000000Z",
+            "2023-11-14T22:14:19.500000Z",
+        ]
+
+    def test_formatter_arguments_forwarded(self):
+        formatter = JsonFormatter("%(message)s", datefmt="%H:%M")
+        assert formatter.datefmt == "%H:%M"
+        assert formatter._fmt == "%(message)s"
+
+
+class TestJsonFormatterSerialization:
+    """Test the orjson fast path and the stdlib fallbacks."""
+
+    def test_extra_fields_included(self):
+        out = json.loads(JsonFormatter().format(_record(count=42, tags=["a"])))
+        assert out["message"] == "hello"
+        assert out["count"] == 42
+        assert out["tags"] == ["a"]
+
+    @pytest.mark.skipif(not log_module.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_orjson_path(self, monkeypatch):
+        def no_stdlib(*args, **kwargs):
+            raise AssertionError("stdlib json used")
+
+        monkeypatch.setattr(log_module.json, "dumps", no_stdlib)
+        out = JsonFormatter().format(_record(handle=object()))
+        assert json.loads(out)["message"] == "hello"
+
+    def test_stdlib_path_matches_orjson(self, monkeypatch):
+        record = _record(created=1700000000.5, count=1, nested={"k": [1, 2]})
+        expected = json.loads(JsonFormatter().format(record))
+        monkeypatch.setattr(log_module, "ORJSON_AVAILABLE", False)
+        assert json.loads(JsonFormatter().format(record)) == expected
+
+    def test_wide_integer_falls_back(self):
+        out = json.loads(JsonFormatter().format(_record(big=1 << 80)))
+        assert out["big"] == 1 << 80
+
+    def test_circular_reference_stringified(self):
+        loop = []
+        loop.append(loop)
+        out = json.loads(JsonFormatter().format(_record(loop=loop, count=3)))
+        assert out["loop"] == str(loop)
+        assert out["count"] == 3
+        assert out["message"] == "hello"
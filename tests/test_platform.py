@@ -149,11 +149,19 @@ class TestBackendFactory:
         backend = get_backend("darwin")
         assert backend is not None
 
+    def test_backend_instance_reused(self):
+        from ram_disk_manager.backends import get_backend
+
+        assert get_backend("linux") is get_backend("linux")
+
     def test_unknown_platform_raises(self):
         from ram_disk_manager.backends import get_backend
 
         with pytest.raises((NotImplementedError, ValueError, KeyError)):
             get_backend("beos")
+        # A failed lookup must not be cached
+        with pytest.raises(NotImplementedError):
+            get_backend("beos")
 
 
 class TestPlatformDetection:
@@ -175,3 +183,70 @@ class TestPlatformDetection:
             # manager (which requires backend availability), but we can verify
             # the mapping is correct.
             assert expected[system] in (Platform.WINDOWS, Platform.LINUX, Platform.MACOS)
+
+
+class TestPlatformPaths:
+    """Test default RAM disk and temp path lookup."""
+
+    def test_default_ram_paths(self):
+        from pathlib import Path
+
+        from ram_disk_manager.utils.platform import get_default_ram_path
+
+        assert get_default_ram_path(Platform.WINDOWS) == Path("R:\\")
+        assert get_default_ram_path(Platform.LINUX) == Path("/mnt/ramdisk")
+        assert get_default_ram_path(Platform.MACOS) == Path("/Volumes")
+
+    def test_auto_resolves_to_detected_platform(self):
+        from ram_disk_manager.utils.platform import (
+            detect_platform,
+            get_default_ram_path,
+            get_temp_path,
+        )
+
+        detected = detect_platform()
+        assert get_default_ram_path(Platform.AUTO) == get_default_ram_path(detected)
+        assert get_temp_path(Platform.AUTO) == get_temp_path(detected)
+
+    def test_check_ram_disk_available(self, tmp_path):
+        from ram_disk_manager.utils.platform import check_ram_disk_available
+
+        assert check_ram_disk_available(tmp_path) is True
+        assert not (tmp_path / ".ram_disk_test").exists()
+        assert check_ram_disk_available(tmp_path / "missing") is False
+
+    def test_ensure_path_exists(self, tmp_path):
+        from ram_disk_manager.utils.platform import ensure_path_exists
+
+        nested = tmp_path / "a" / "b"
+        assert ensure_path_exists(nested) is True
+        assert nested.is_dir()
+        assert ensure_path_exists(nested) is True
+
+        file_path = tmp_path / "c" / "file.txt"
+        assert ensure_path_exists(file_path, is_dir=False) is True
+        assert file_path.parent.is_dir()
+        assert not file_path.exists()
+
+    def test_is_admin_cached(self):
+        from ram_disk_manager.utils.platform import is_admin
+
+        assert is_admin() is is_admin()
+        assert is_admin.cache_info().hits >= 1
+
+    def test_is_admin_token_argument_error(self, monkeypatch):
+        """A ctypes conversion failure reads as "not elevated", not an error."""
+        import ctypes
+        from ram_disk_manager.utils import platform as platform_module
+
+        def bad_handle():
+            raise ctypes.ArgumentError("argument 1: wrong type")
+
+        monkeypatch.setattr(platform_module.sys, "platform", "win32")
+        monkeypatch.delattr(ctypes, "windll", raising=False)
+        monkeypatch.setattr(platform_module, "_is_token_elevated", bad_handle)
+        platform_module.is_admin.cache_clear()
+        try:
+            assert platform_module.is_admin() is False
+        finally:
+            platform_module.is_admin.cache_clear()
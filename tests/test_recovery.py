@@ -3,6 +3,7 @@
 Validates crash detection, integrity verification, and automatic recovery.
 """
 
+import errno
 import json
 from pathlib import Path
 
@@ -16,11 +17,13 @@ from ram_disk_manager.recovery.detector import (
     get_shutdown_info,
 )
 from ram_disk_manager.recovery.integrity import (
+    INTEGRITY_ALGORITHM,
     verify_integrity,
     verify_single_file,
     IntegrityResult,
 )
 from ram_disk_manager.recovery.auto_sync import RecoveryManager, RecoveryResult
+from ram_disk_manager.utils.hashing import fast_hash_file
 
 
 class TestShutdownDetector:
@@ -48,6 +51,19 @@ class TestShutdownDetector:
         marker_path.write_text("not valid json {{{")
         assert was_clean_shutdown(sample_config) is False
 
+    def test_non_object_marker_not_parsed(self, sample_config, monkeypatch):
+        """Content that can't be a JSON object is rejected before parsing."""
+        from ram_disk_manager.recovery import detector
+
+        def fail_loads(data):
+            raise AssertionError("parser should not run")
+
+        monkeypatch.setattr(detector, "_loads", fail_loads)
+        marker_path = sample_config.disk_path / ".ram_disk_clean_shutdown"
+        for content in ("not valid json {{{", "[true]", "", "{\"clean_shutdown\""):
+            marker_path.write_text(content)
+            assert was_clean_shutdown(sample_config) is False
+
     def test_marker_missing_required_field(self, sample_config):
         """Marker without 'clean_shutdown' key should be treated as crash."""
         marker_path = sample_config.disk_path / ".ram_disk_clean_shutdown"
@@ -69,6 +85,106 @@ class TestShutdownDetector:
         assert "timestamp" in info
         assert info["name"] == "test_disk"
 
+    def test_marker_written_in_one_call(self, sample_config, monkeypatch):
+        """The encoded marker goes to the kernel in a single write."""
+        from ram_disk_manager.recovery import detector
+
+        writes = []
+        original_write = detector.os.write
+
+        def counting_write(fd, data):
+            writes.append(len(data))
+            return original_write(fd, data)
+
+        monkeypatch.setattr(detector.os, "write", counting_write)
+        assert mark_clean_shutdown(sample_config) is True
+        monkeypatch.undo()
+
+        assert len(writes) == 1
+        assert get_shutdown_info(sample_config)["clean_shutdown"] is True
+
+    def test_existing_marker_replaced(self, sample_config):
+        marker_path = sample_config.disk_path / ".ram_disk_clean_shutdown"
+        marker_path.write_text("stale marker contents")
+        assert mark_clean_shutdown(sample_config) is True
+        assert was_clean_shutdown(sample_config) is True
+        assert not [
+            p for p in sample_config.disk_path.iterdir() if p != marker_path
+        ]
+
+    def test_existing_marker_replaced_atomically(self, sample_config, monkeypatch):
+        """The marker is renamed over, never unlinked first."""
+        from ram_disk_manager.recovery import detector
+
+        if not detector._HAS_TMPFILE:
+            pytest.skip("O_TMPFILE not available")
+
+        def no_unlink(*args, **kwargs):
+            raise AssertionError("marker unlinked before replacement")
+
+        marker_path = sample_config.disk_path / ".ram_disk_clean_shutdown"
+        marker_path.write_text("stale marker contents")
+        monkeypatch.setattr(detector.os, "unlink", no_unlink)
+        assert mark_clean_shutdown(sample_config) is True
+        monkeypatch.undo()
+
+        assert was_clean_shutdown(sample_config) is True
+        assert [p.name for p in sample_config.disk_path.iterdir()] == [
+            ".ram_disk_clean_shutdown"
+        ]
+
+    def test_marker_without_tmpfile(self, sample_config, monkeypatch):
+        """Where O_TMPFILE is unavailable the marker is written in place."""
+        from ram_disk_manager.recovery import detector
+
+        monkeypatch.setattr(detector, "_HAS_TMPFILE", False)
+        assert mark_clean_shutdown(sample_config) is True
+        assert mark_clean_shutdown(sample_config) is True
+        assert was_clean_shutdown(sample_config) is True
+
+    def test_marker_when_link_not_permitted(self, sample_config, monkeypatch):
+        """EPERM from linkat falls back to writing the marker in place."""
+        from ram_disk_manager.recovery import detector
+
+        if not detector._HAS_TMPFILE:
+            pytest.skip("O_TMPFILE not available")
+
+        links = []
+
+        def refuse_link(*args, **kwargs):
+            links.append(args)
+            raise PermissionError(errno.EPERM, "Operation not permitted")
+
+        monkeypatch.setattr(detector.os, "link", refuse_link)
+        sample_config.disk_path.joinpath(".ram_disk_clean_shutdown").write_text(
+            "stale marker contents"
+        )
+        assert mark_clean_shutdown(sample_config) is True
+        monkeypatch.undo()
+
+        assert len(links) == 1
+        assert was_clean_shutdown(sample_config) is True
+        assert get_shutdown_info(sample_config)["name"] == "test_disk"
+        assert not [
+            p for p in sample_config.disk_path.iterdir()
+            if p.name != ".ram_disk_clean_shutdown"
+        ]
+
+    def test_stdlib_json_fallback(self, sample_config, monkeypatch):
+        """Markers round-trip the same without orjson."""
+        from ram_disk_manager.recovery import detector
+
+        monkeypatch.setattr(detector, "ORJSON_AVAILABLE", False)
+        assert mark_clean_shutdown(sample_config) is True
+        assert was_clean_shutdown(sample_config) is True
+        assert get_shutdown_info(sample_config)["name"] == "test_disk"
+
+    def test_non_utf8_marker(self, sample_config):
+        """Undecodable marker bytes should indicate crash, not raise."""
+        marker_path = sample_config.disk_path / ".ram_disk_clean_shutdown"
+        marker_path.write_bytes(b"\xff\xfe{")
+        assert was_clean_shutdown(sample_config) is False
+
     def test_get_shutdown_info_no_marker(self, sample_config):
         """get_shutdown_info should return None if no marker."""
         assert get_shutdown_info(sample_config) is None
@@ -145,6 +261,59 @@ class TestIntegrityVerification:
         assert result.is_valid is False
         assert "file1.txt" in result.mismatched_files
 
+    def test_hashes_use_integrity_algorithm(self, populated_dirs):
+        """Recorded hashes come from the integrity algorithm."""
+        disk = populated_dirs["disk"]
+        config = RamDiskConfig(name="test", disk_path=disk, ram_path=populated_dirs["ram"])
+        result = verify_integrity(config)
+        assert result.disk_hashes["file1.txt"] == fast_hash_file(
+            disk / "file1.txt", INTEGRITY_ALGORITHM
+        )
+
+        result = verify_integrity(config, algorithm="sha256")
+        assert len(result.disk_hashes["file1.txt"]) == 64
+
+    def test_matching_stat_skips_hashing(self, populated_dirs, monkeypatch):
+        """copy2'd files with equal size and mtime are verified unread."""
+        import shutil
+        from ram_disk_manager.utils import hashing
+
+        disk = populated_dirs["disk"]
+        ram = populated_dirs["ram"]
+        shutil.copytree(disk, ram, dirs_exist_ok=True)
+
+        def no_hash(*args, **kwargs):
+            raise AssertionError("file hashed despite matching stat")
+
+        monkeypatch.setattr(hashing, "fast_hash_file", no_hash)
+        config = RamDiskConfig(name="test", disk_path=disk, ram_path=ram)
+        result = verify_integrity(config)
+        assert result.is_valid is True
+        assert result.verified_count == result.total_files == 4
+        assert sorted(result.stat_verified) == sorted(
+            ["file1.txt", "file2.json", "subdir/nested.txt", "data.bin"]
+        )
+
+    def test_full_check_catches_same_stat_corruption(self, populated_dirs):
+        """quick=False hashes files even when size and mtime match."""
+        import os
+        import shutil
+
+        disk = populated_dirs["disk"]
+        ram = populated_dirs["ram"]
+        shutil.copytree(disk, ram, dirs_exist_ok=True)
+
+        original = (disk / "file1.txt").read_bytes()
+        corrupted = ram / "file1.txt"
+        corrupted.write_bytes(bytes(len(original)))
+        st = os.stat(disk / "file1.txt")
+        os.utime(corrupted, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        config = RamDiskConfig(name="test", disk_path=disk, ram_path=ram)
+        assert verify_integrity(config).is_valid is True
+        result = verify_integrity(config, quick=False)
+        assert result.mismatched_files == ["file1.txt"]
+
     def test_disk_path_missing(self, tmp_path):
         """Missing disk path should report error."""
         config = RamDiskConfig(
@@ -255,6 +424,30 @@ class TestRecoveryManager:
         assert result.clean_shutdown is True
         # May or may not need recovery depending on integrity check
 
+    def test_recovery_copies_only_integrity_failures(
+        self, populated_dirs, sample_manager_config
+    ):
+        """After a clean shutdown, only files the check flagged are copied."""
+        import shutil
+
+        disk = populated_dirs["disk"]
+        ram = populated_dirs["ram"]
+        shutil.copytree(disk, ram, dirs_exist_ok=True)
+        (ram / "file1.txt").write_text("stale")
+        (ram / "subdir" / "nested.txt").unlink()
+
+        config = RamDiskConfig(name="test", disk_path=disk, ram_path=ram)
+        mark_clean_shutdown(config, sample_manager_config)
+
+        mgr = RecoveryManager(sample_manager_config)
+        result = mgr.recover(config)
+
+        assert result.recovery_needed is True
+        assert sorted(Path(p).as_posix() for p in result.files_copied) == [
+            "file1.txt", "subdir/nested.txt"
+        ]
+        assert result.integrity_after.is_valid is True
+
     def test_forced_recovery(self, populated_dirs, sample_manager_config):
         """force_full_sync should always trigger recovery."""
         config = RamDiskConfig(
@@ -297,6 +490,36 @@ class TestRecoveryManager:
         assert "disk_path_exists" in status
         assert status["disk_path_exists"] is True
 
+    def test_check_status_parses_marker_once(
+        self, populated_dirs, sample_manager_config, monkeypatch
+    ):
+        """Repeated status checks reuse the parsed marker until it changes."""
+        from ram_disk_manager.recovery import detector
+
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+        )
+        mark_clean_shutdown(config, sample_manager_config)
+
+        loads = []
+        original_loads = detector._loads
+
+        def counting_loads(data):
+            loads.append(data)
+            return original_loads(data)
+
+        monkeypatch.setattr(detector, "_loads", counting_loads)
+        mgr = RecoveryManager(sample_manager_config)
+        assert mgr.check_status(config)["clean_shutdown"] is True
+        assert mgr.check_status(config)["shutdown_info"]["name"] == "test"
+        assert len(loads) == 1
+
+        # recover() removes the marker, so the cache must not go stale
+        mgr.recover(config, verify_after=False)
+        assert mgr.check_status(config)["clean_shutdown"] is False
+
     def test_recovery_result_to_dict(self):
         """RecoveryResult.to_dict should serialize cleanly."""
         r = RecoveryResult(
@@ -4,13 +4,17 @@ Validates SyncEngine: disk-to-RAM sync, RAM-to-disk sync, incremental sync,
 hash-based change detection, and integrity verification.
 """
 
+import errno
 import json
+import os
 import shutil
+import socket
 from pathlib import Path
 
 import pytest
 
 from ram_disk_manager.config import RamDiskConfig, SyncStrategy
+from ram_disk_manager.sync import engine as engine_module
 from ram_disk_manager.sync.engine import SyncEngine, SyncStats
 
 
@@ -43,8 +47,8 @@ class TestSyncEngineDiskToRam:
             sync_strategy=SyncStrategy.FULL,
             verify_integrity=False,
         )
-        engine = SyncEngine(config)
-        stats = engine.disk_to_ram()
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
 
         assert stats.success is True
         assert stats.direction == "disk_to_ram"
@@ -57,6 +61,74 @@ class TestSyncEngineDiskToRam:
         assert (populated_dirs["ram"] / "file2.json").exists()
         assert (populated_dirs["ram"] / "subdir" / "nested.txt").exists()
 
+    def test_full_sync_unlinks_symlinked_dir(self, populated_dirs):
+        """Clearing RAM removes a directory symlink, not its target."""
+        outside = populated_dirs["root"] / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        try:
+            (populated_dirs["ram"] / "link").symlink_to(
+                outside, target_is_directory=True
+            )
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+            sync_strategy=SyncStrategy.FULL,
+            verify_integrity=False,
+        )
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
+
+        assert stats.success is True
+        assert not (populated_dirs["ram"] / "link").exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+
+    def test_full_sync_relative_disk_path(self, populated_dirs, monkeypatch):
+        monkeypatch.chdir(populated_dirs["disk"])
+        config = RamDiskConfig(
+            name="test",
+            disk_path=Path("."),
+            ram_path=populated_dirs["ram"],
+            sync_strategy=SyncStrategy.FULL,
+            verify_integrity=False,
+        )
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
+
+        ram = populated_dirs["ram"]
+        assert stats.success is True
+        assert (ram / "file1.txt").read_text() == "hello world"
+        assert (ram / "subdir" / "nested.txt").read_text() == "nested content"
+        assert sorted(p.name for p in ram.iterdir()) == [
+            "data.bin", "file1.txt", "file2.json", "subdir"
+        ]
+
+    def test_full_sync_skips_dangling_symlink(self, populated_dirs):
+        try:
+            (populated_dirs["disk"] / "broken").symlink_to(
+                populated_dirs["root"] / "missing"
+            )
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+            sync_strategy=SyncStrategy.FULL,
+            verify_integrity=False,
+        )
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
+
+        assert stats.success is True
+        assert stats.errors == []
+        assert not os.path.lexists(populated_dirs["ram"] / "broken")
+
     def test_incremental_sync(self, populated_dirs):
         config = RamDiskConfig(
             name="test",
@@ -68,20 +140,19 @@ class TestSyncEngineDiskToRam:
         # Store hash cache outside the synced directory to avoid it being
         # picked up as a file change on second sync
         hash_cache = populated_dirs["root"] / ".hash_cache.json"
-        engine = SyncEngine(config, hash_cache_path=hash_cache)
-
-        # First sync - everything is new
-        stats1 = engine.disk_to_ram()
-        assert stats1.success is True
-        assert stats1.files_copied > 0
-
-        # Second sync - nothing changed
-        stats2 = engine.disk_to_ram()
+        with SyncEngine(config, hash_cache_path=hash_cache) as engine:
+            # First sync - everything is new
+            stats1 = engine.disk_to_ram()
+            assert stats1.success is True
+            assert stats1.files_copied > 0
+
+            # Second sync - nothing changed
+            stats2 = engine.disk_to_ram()
         assert stats2.success is True
         assert stats2.files_copied == 0
         assert stats2.files_unchanged > 0
 
-    def test_incremental_detects_changes(self, populated_dirs):
+    def test_unchanged_hash_cache_not_rewritten(self, populated_dirs):
         config = RamDiskConfig(
             name="test",
             disk_path=populated_dirs["disk"],
@@ -89,16 +160,115 @@ class TestSyncEngineDiskToRam:
             sync_strategy=SyncStrategy.INCREMENTAL,
             verify_integrity=False,
         )
-        engine = SyncEngine(config)
+        hash_cache = populated_dirs["root"] / ".hash_cache.json"
+        with SyncEngine(config, hash_cache_path=hash_cache) as engine:
+            engine.disk_to_ram()
+            saved = json.loads(hash_cache.read_text())
+            assert "file1.txt" in saved
+            os.utime(hash_cache, ns=(1_000_000_000, 1_000_000_000))
+
+            # Nothing changed on disk, so the cache file is left alone
+            engine.disk_to_ram()
+            assert hash_cache.stat().st_mtime_ns == 1_000_000_000
+
+            (populated_dirs["disk"] / "file1.txt").write_text("MODIFIED")
+            engine.disk_to_ram()
+        with SyncEngine(config, hash_cache_path=hash_cache) as reloaded:
+            assert reloaded._hash_cache["file1.txt"] != saved["file1.txt"]
+
+    def test_hash_cache_changes_appended_to_log(self, tmp_dirs):
+        disk = tmp_dirs["disk"]
+        for i in range(50):
+            (disk / f"f{i:02d}.txt").write_text(f"content {i}")
+        config = RamDiskConfig(
+            name="test",
+            disk_path=disk,
+            ram_path=tmp_dirs["ram"],
+            sync_strategy=SyncStrategy.INCREMENTAL,
+            verify_integrity=False,
+        )
+        hash_cache = tmp_dirs["root"] / ".hash_cache.json"
+        with SyncEngine(config, hash_cache_path=hash_cache) as engine:
+            engine.disk_to_ram()
+            snapshot = hash_cache.read_bytes()
+            log_path = tmp_dirs["root"] / ".hash_cache.json.log"
+            assert not log_path.exists()
+
+            # A small change is logged; the snapshot is left alone
+            (disk / "f00.txt").write_text("changed")
+            (disk / "f01.txt").unlink()
+            engine.disk_to_ram()
+            assert hash_cache.read_bytes() == snapshot
+            records = [json.loads(line) for line in log_path.read_text().splitlines()]
+            assert sorted((r["op"], r["path"]) for r in records) == [
+                ("delete", "f01.txt"),
+                ("upsert", "f00.txt"),
+            ]
+
+            with SyncEngine(config, hash_cache_path=hash_cache) as reloaded:
+                assert reloaded._hash_cache == engine._hash_cache
+
+            # Changing most files compacts the log back into the snapshot
+            for i in range(2, 50):
+                (disk / f"f{i:02d}.txt").write_text(f"rewritten {i}")
+            engine.disk_to_ram()
+            assert not log_path.exists()
+            assert json.loads(hash_cache.read_text()) == engine._hash_cache
+
+    def test_torn_hash_log_entry_ignored(self, populated_dirs):
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+            verify_integrity=False,
+        )
+        hash_cache = populated_dirs["root"] / ".hash_cache.json"
+        with SyncEngine(config, hash_cache_path=hash_cache) as engine:
+            engine.disk_to_ram()
+        expected = json.loads(hash_cache.read_text())
+        log_path = populated_dirs["root"] / ".hash_cache.json.log"
+        log_path.write_bytes(b'{"op":"upsert","path":"file1.tx')
 
-        # Initial sync
-        engine.disk_to_ram()
+        with SyncEngine(config, hash_cache_path=hash_cache) as engine:
+            assert engine._hash_cache == expected
+            assert engine._hash_cache_dirty is True
+
+    def test_hash_cache_uses_fingerprint_algorithm(self, populated_dirs):
+        from ram_disk_manager.utils.hashing import fast_hash_file
 
-        # Modify a file on disk
-        (populated_dirs["disk"] / "file1.txt").write_text("MODIFIED")
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+            verify_integrity=False,
+        )
+        hash_cache = populated_dirs["root"] / ".hash_cache.json"
+        with SyncEngine(config, hash_cache_path=hash_cache) as engine:
+            engine.disk_to_ram()
+
+        saved = json.loads(hash_cache.read_text())
+        assert saved["file1.txt"] == fast_hash_file(
+            populated_dirs["disk"] / "file1.txt",
+            engine_module.FINGERPRINT_ALGORITHM,
+        )
 
-        # Incremental should detect the change
-        stats = engine.disk_to_ram()
+    def test_incremental_detects_changes(self, populated_dirs):
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+            sync_strategy=SyncStrategy.INCREMENTAL,
+            verify_integrity=False,
+        )
+        with SyncEngine(config) as engine:
+            # Initial sync
+            engine.disk_to_ram()
+
+            # Modify a file on disk
+            (populated_dirs["disk"] / "file1.txt").write_text("MODIFIED")
+
+            # Incremental should detect the change
+            stats = engine.disk_to_ram()
         assert stats.success is True
         assert stats.files_copied >= 1
 
@@ -113,19 +283,50 @@ class TestSyncEngineDiskToRam:
             sync_strategy=SyncStrategy.INCREMENTAL,
             verify_integrity=False,
         )
-        engine = SyncEngine(config)
-        stats = engine.disk_to_ram(force_full=True)
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram(force_full=True)
         assert stats.strategy == "full"
         assert stats.success is True
 
+    def test_context_manager(self, populated_dirs):
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+            verify_integrity=True,
+        )
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
+        assert stats.success is True
+        assert stats.errors == []
+
+    def test_worker_pool_started_lazily(self, populated_dirs):
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs["disk"],
+            ram_path=populated_dirs["ram"],
+            verify_integrity=False,
+        )
+        engine = SyncEngine(config)
+        assert engine._pool is None
+
+        engine.disk_to_ram()
+        pool = engine._pool
+        assert pool is not None
+        assert engine._executor() is pool
+
+        engine.close()
+        assert engine._pool is None
+        engine.close()
+
     def test_no_ram_path_fails(self, tmp_path):
         config = RamDiskConfig(
             name="test",
             disk_path=tmp_path,
             ram_path=None,
         )
-        engine = SyncEngine(config)
-        stats = engine.disk_to_ram()
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
         assert stats.success is False
         assert "RAM path not configured" in stats.errors[0]
 
@@ -135,11 +336,39 @@ class TestSyncEngineDiskToRam:
             disk_path=tmp_path / "nonexistent",
             ram_path=tmp_path / "ram",
         )
-        engine = SyncEngine(config)
-        stats = engine.disk_to_ram()
+        with SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
         assert stats.success is False
         assert "does not exist" in stats.errors[0]
 
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="POSIX special files")
+    def test_full_sync_skips_special_files(self, populated_dirs):
+        """A FIFO or socket on disk must not stall the copy."""
+        disk = populated_dirs["disk"]
+        os.mkfifo(disk / "pipe")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(str(disk / "sock"))
+        except OSError:
+            sock.close()
+            pytest.skip("cannot bind a Unix socket here")
+
+        config = RamDiskConfig(
+            name="test",
+            disk_path=disk,
+            ram_path=populated_dirs["ram"],
+            sync_strategy=SyncStrategy.FULL,
+            verify_integrity=False,
+        )
+        with sock, SyncEngine(config) as engine:
+            stats = engine.disk_to_ram()
+
+        assert stats.success is True
+        ram = populated_dirs["ram"]
+        assert (ram / "file1.txt").read_text() == "hello world"
+        assert not (ram / "pipe").exists()
+        assert not (ram / "sock").exists()
+
 
 class TestSyncEngineRamToDisk:
     """Test RAM-to-disk sync (persistence)."""
@@ -151,30 +380,59 @@ class TestSyncEngineRamToDisk:
             ram_path=populated_dirs["ram"],
             verify_integrity=False,
         )
-        engine = SyncEngine(config)
-
-        # Initial sync disk -> RAM
-        engine.disk_to_ram()
+        with SyncEngine(config) as engine:
+            # Initial sync disk -> RAM
+            engine.disk_to_ram()
 
-        # Create new file in RAM
-        (populated_dirs["ram"] / "new_file.txt").write_text("created in RAM")
+            # Create new file in RAM
+            (populated_dirs["ram"] / "new_file.txt").write_text("created in RAM")
 
-        # Sync RAM -> disk
-        stats = engine.ram_to_disk()
+            # Sync RAM -> disk
+            stats = engine.ram_to_disk()
         assert stats.success is True
         assert stats.direction == "ram_to_disk"
 
         # Verify new file persisted to disk
         assert (populated_dirs["disk"] / "new_file.txt").read_text() == "created in RAM"
 
+    def test_hash_cache_files_not_synced(self, tmp_dirs):
+        """The default cache and its log in disk_path survive ram_to_disk."""
+        disk, ram = tmp_dirs["disk"], tmp_dirs["ram"]
+        for i in range(20):
+            (disk / f"f{i:02d}.txt").write_text(f"content {i}")
+        config = RamDiskConfig(
+            name="test",
+            disk_path=disk,
+            ram_path=ram,
+            sync_strategy=SyncStrategy.INCREMENTAL,
+            verify_integrity=False,
+        )
+        with SyncEngine(config) as engine:
+            engine.disk_to_ram()
+            assert not (ram / ".ram_disk_hashes.json").exists()
+
+            (ram / "f00.txt").write_text("edited in RAM")
+            (ram / "new.txt").write_text("created in RAM")
+            stats = engine.ram_to_disk()
+
+        assert stats.success is True
+        assert stats.files_deleted == 0
+        assert (disk / ".ram_disk_hashes.json").exists()
+        assert (disk / ".ram_disk_hashes.json.log").exists()
+
+        with SyncEngine(config) as reloaded:
+            assert reloaded._hash_cache == reloaded._hash_directory(disk)
+            assert ".ram_disk_hashes.json" not in reloaded._hash_cache
+            assert "new.txt" in reloaded._hash_cache
+
     def test_no_ram_path_fails(self, tmp_path):
         config = RamDiskConfig(
             name="test",
             disk_path=tmp_path,
             ram_path=None,
         )
-        engine = SyncEngine(config)
-        stats = engine.ram_to_disk()
+        with SyncEngine(config) as engine:
+            stats = engine.ram_to_disk()
         assert stats.success is False
 
     def test_missing_ram_fails(self, tmp_path):
@@ -183,11 +441,136 @@ class TestSyncEngineRamToDisk:
             disk_path=tmp_path,
             ram_path=tmp_path / "nonexistent_ram",
         )
-        engine = SyncEngine(config)
-        stats = engine.ram_to_disk()
+        with SyncEngine(config) as engine:
+            stats = engine.ram_to_disk()
         assert stats.success is False
 
 
+class TestCopyFile:
+    """Test the in-kernel file copy helper."""
+
+    def test_copies_data_and_mtime(self, tmp_path):
+        src = tmp_path / "src.bin"
+        dst = tmp_path / "dst.bin"
+        src.write_bytes(os.urandom(200_000))
+        os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+
+        assert engine_module._copy_file(src, dst) == 200_000
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_copies_permissions(self, tmp_path):
+        src = tmp_path / "src.sh"
+        dst = tmp_path / "dst.sh"
+        src.write_text("#!/bin/sh\n")
+        src.chmod(0o750)
+
+        engine_module._copy_file(src, dst)
+
+        assert (dst.stat().st_mode & 0o777) == 0o750
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="POSIX special files")
+    def test_rejects_fifo_without_blocking(self, tmp_path):
+        src = tmp_path / "pipe"
+        dst = tmp_path / "dst"
+        os.mkfifo(src)
+
+        with pytest.raises(shutil.SpecialFileError):
+            engine_module._copy_file(src, dst)
+        assert not dst.exists()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets")
+    def test_rejects_socket(self, tmp_path):
+        src = tmp_path / "sock"
+        dst = tmp_path / "dst"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind(str(src))
+            except OSError:
+                pytest.skip("cannot bind a Unix socket here")
+
+            with pytest.raises(OSError):
+                engine_module._copy_file(src, dst)
+        assert not dst.exists()
+
+    def test_patch_rewrites_only_changed_blocks(self, tmp_path):
+        src = tmp_path / "src.bin"
+        dst = tmp_path / "dst.bin"
+        data = bytearray(os.urandom(2 * engine_module._PATCH_MIN_SIZE + 123))
+        dst.write_bytes(data)
+        data[1_500_000:1_500_010] = b"x" * 10
+        src.write_bytes(data)
+
+        written = engine_module._patch_file(src, dst)
+
+        assert written == engine_module._PATCH_BLOCK
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    def test_patch_copies_when_size_differs(self, tmp_path):
+        src = tmp_path / "src.bin"
+        dst = tmp_path / "dst.bin"
+        src.write_bytes(os.urandom(engine_module._PATCH_MIN_SIZE + 1))
+        dst.write_bytes(b"short")
+
+        assert engine_module._patch_file(src, dst) == src.stat().st_size
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_falls_back_when_kernel_copy_unsupported(self, tmp_path, monkeypatch):
+        def unsupported(infd, outfd, offset, count):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(engine_module, "_KERNEL_COPIERS", [unsupported])
+        monkeypatch.setattr(engine_module, "_UNSUPPORTED_COPIERS", {})
+        src = tmp_path / "src.txt"
+        dst = tmp_path / "dst.txt"
+        src.write_text("fallback content")
+
+        engine_module._copy_file(src, dst)
+
+        assert dst.read_text() == "fallback content"
+
+    def test_unsupported_copier_not_retried(self, tmp_path, monkeypatch):
+        calls = []
+
+        def cross_device(infd, outfd, offset, count):
+            calls.append(count)
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(engine_module, "_KERNEL_COPIERS", [cross_device])
+        monkeypatch.setattr(engine_module, "_UNSUPPORTED_COPIERS", {})
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_text(name)
+            engine_module._copy_file(tmp_path / name, tmp_path / f"copy_{name}")
+            assert (tmp_path / f"copy_{name}").read_text() == name
+
+        assert len(calls) == 1
+
+    def test_unsupported_copier_cached_per_device_pair(self, tmp_path, monkeypatch):
+        """A copier failing for one device pair is still tried for another."""
+        calls = []
+
+        def cross_device(infd, outfd, offset, count):
+            calls.append(count)
+            raise OSError(errno.EXDEV, "cross-device")
+
+        dev = tmp_path.stat().st_dev
+        monkeypatch.setattr(engine_module, "_KERNEL_COPIERS", [cross_device])
+        monkeypatch.setattr(
+            engine_module, "_UNSUPPORTED_COPIERS", {(dev, dev + 1): {cross_device}}
+        )
+        src = tmp_path / "src.txt"
+        src.write_text("same device")
+
+        engine_module._copy_file(src, tmp_path / "dst.txt")
+
+        assert len(calls) == 1
+        assert (tmp_path / "dst.txt").read_text() == "same device"
+        assert (dev, dev) in engine_module._UNSUPPORTED_COPIERS
+
+
 class TestSyncEngineStatus:
     """Test sync status reporting."""
 
@@ -201,28 +584,37 @@ class TestSyncEngineStatus:
         # Store hash cache outside synced dirs so it doesn't create
         # a difference between disk and RAM
         hash_cache = populated_dirs["root"] / ".hash_cache.json"
-        engine = SyncEngine(config, hash_cache_path=hash_cache)
-        engine.disk_to_ram(force_full=True)
+        with SyncEngine(config, hash_cache_path=hash_cache) as engine:
+            engine.disk_to_ram(force_full=True)
 
-        status = engine.get_sync_status()
+            status = engine.get_sync_status()
         assert status["disk_exists"] is True
         assert status["ram_exists"] is True
         assert status["in_sync"] is True
 
-    def test_out_of_sync_status(self, populated_dirs):
+    def test_out_of_sync_status(self, populated_dirs_ro):
         config = RamDiskConfig(
             name="test",
-            disk_path=populated_dirs["disk"],
-            ram_path=populated_dirs["ram"],
+            disk_path=populated_dirs_ro["disk"],
+            ram_path=populated_dirs_ro["ram"],
         )
-        engine = SyncEngine(config)
-
-        # Don't sync - should be out of sync
-        status = engine.get_sync_status()
+        with SyncEngine(config) as engine:
+            # Don't sync - should be out of sync
+            status = engine.get_sync_status()
         assert status["in_sync"] is False
         assert status["differences"] is not None
         assert len(status["differences"]["disk_only"]) > 0
 
+    def test_status_differences_sorted(self, populated_dirs_ro):
+        config = RamDiskConfig(
+            name="test",
+            disk_path=populated_dirs_ro["disk"],
+            ram_path=populated_dirs_ro["ram"],
+        )
+        with SyncEngine(config) as engine:
+            disk_only = engine.get_sync_status()["differences"]["disk_only"]
+        assert disk_only == sorted(disk_only)
+
     def test_status_missing_ram(self, tmp_path):
         disk = tmp_path / "disk"
         disk.mkdir()
@@ -231,7 +623,7 @@ class TestSyncEngineStatus:
             disk_path=disk,
             ram_path=tmp_path / "nonexistent_ram",
         )
-        engine = SyncEngine(config)
-        status = engine.get_sync_status()
+        with SyncEngine(config) as engine:
+            status = engine.get_sync_status()
         assert status["ram_exists"] is False
         assert status["in_sync"] is False